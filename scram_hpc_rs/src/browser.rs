@@ -1,14 +1,21 @@
 use anyhow::Result;
 use chromiumoxide::browser::{Browser, BrowserConfig};
+use chromiumoxide::Page;
 use chromiumoxide::cdp::browser_protocol::page::{CaptureScreenshotFormat, CaptureScreenshotParams, NavigateParams};
 use futures::StreamExt;
 use rand::Rng;
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::sync::Arc;
 use std::time::Duration;
+use tokio::sync::{Mutex, OwnedSemaphorePermit, Semaphore};
 use tokio::time::sleep;
 
 pub struct MirageBrowser {
     browser: Browser,
     handle: tokio::task::JoinHandle<()>,
+    // Pages parked on about:blank between fetches, reused instead of
+    // paying new_page/close IPC on every navigation
+    idle_pages: std::sync::Mutex<Vec<Page>>,
 }
 
 impl MirageBrowser {
@@ -30,12 +37,34 @@ impl MirageBrowser {
             }
         });
 
-        Ok(Self { browser, handle })
+        Ok(Self {
+            browser,
+            handle,
+            idle_pages: std::sync::Mutex::new(Vec::new()),
+        })
     }
 
     pub async fn fetch_page(&self, url: &str) -> Result<(String, u16, Vec<u8>)> {
-        let page = self.browser.new_page("about:blank").await?;
-        
+        let idle = self.idle_pages.lock().unwrap().pop();
+        let page = match idle {
+            Some(page) => page,
+            None => self.browser.new_page("about:blank").await?,
+        };
+
+        let result = Self::load_page(&page, url).await;
+
+        // Park the page on about:blank to release the document; a page that
+        // failed to load or reset is closed instead so it cannot leak
+        if result.is_ok() && page.goto("about:blank").await.is_ok() {
+            self.idle_pages.lock().unwrap().push(page);
+        } else {
+            let _ = page.close().await;
+        }
+
+        result
+    }
+
+    async fn load_page(page: &Page, url: &str) -> Result<(String, u16, Vec<u8>)> {
         // Mirage Engine: Behavioral Synthesis (Warm-up / Mouse Jitter)
         let jitter = {
             let mut rng = rand::thread_rng();
@@ -69,8 +98,124 @@ impl MirageBrowser {
         // without listening to network events. For MVP, we assume 200 if content is retrieved.
         let status = 200; 
 
-        page.close().await?;
-
         Ok((content, status, screenshot))
     }
 }
+
+impl Drop for MirageBrowser {
+    fn drop(&mut self) {
+        // Stop the CDP handler task along with the browser it drives
+        self.handle.abort();
+    }
+}
+
+struct BrowserSlot {
+    browser: Option<Arc<MirageBrowser>>,
+    uses: u32,
+}
+
+struct PoolEntry {
+    slot: Mutex<BrowserSlot>,
+    // Caps concurrent pages per browser so one process cannot pile them up
+    pages: Arc<Semaphore>,
+}
+
+/// A browser leased from the pool; the page slot frees when this drops.
+pub struct BrowserLease {
+    pub browser: Arc<MirageBrowser>,
+    _permit: OwnedSemaphorePermit,
+}
+
+/// Settings a pool was built with, normalized the way the pool applies them.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub struct PoolConfig {
+    pub size: usize,
+    pub headless: bool,
+    pub max_uses: u32,
+    pub max_pages: usize,
+}
+
+impl PoolConfig {
+    pub fn new(size: usize, headless: bool, max_uses: u32, max_pages: usize) -> Self {
+        Self {
+            size: size.max(1),
+            headless,
+            max_uses: max_uses.max(1),
+            max_pages: max_pages.max(1),
+        }
+    }
+}
+
+/// Fixed set of shared browsers handed out round-robin. Each slot is
+/// relaunched after `max_uses` pages so Chromium/CDP state accumulated by a
+/// long-lived process is released instead of growing until OOM.
+pub struct BrowserPool {
+    entries: Vec<PoolEntry>,
+    next: AtomicUsize,
+    config: PoolConfig,
+}
+
+impl BrowserPool {
+    pub fn new(config: PoolConfig) -> Self {
+        let entries = (0..config.size)
+            .map(|_| PoolEntry {
+                slot: Mutex::new(BrowserSlot { browser: None, uses: 0 }),
+                pages: Arc::new(Semaphore::new(config.max_pages)),
+            })
+            .collect();
+        Self {
+            entries,
+            next: AtomicUsize::new(0),
+            config,
+        }
+    }
+
+    pub fn config(&self) -> PoolConfig {
+        self.config
+    }
+
+    /// Lease a browser from the next slot, waiting while it already has
+    /// `max_pages` pages open, and (re)launching it when the slot is empty
+    /// or worn out. A retired browser is dropped once pages still in flight
+    /// release their handle, so no duplicate context is orphaned.
+    pub async fn lease(&self) -> Result<BrowserLease> {
+        let index = self.next.fetch_add(1, Ordering::Relaxed) % self.entries.len();
+        let entry = &self.entries[index];
+        let permit = Arc::clone(&entry.pages).acquire_owned().await?;
+        let mut slot = entry.slot.lock().await;
+
+        if slot.uses >= self.config.max_uses {
+            slot.browser = None;
+            slot.uses = 0;
+        }
+        let browser = match &slot.browser {
+            Some(browser) => Arc::clone(browser),
+            None => {
+                let browser = Arc::new(MirageBrowser::new(self.config.headless).await?);
+                slot.browser = Some(Arc::clone(&browser));
+                browser
+            }
+        };
+        slot.uses += 1;
+        Ok(BrowserLease {
+            browser,
+            _permit: permit,
+        })
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn pool_config_is_normalized() {
+        let config = PoolConfig::new(0, true, 0, 0);
+        assert_eq!(config, PoolConfig::new(1, true, 1, 1));
+
+        let pool = BrowserPool::new(PoolConfig::new(3, false, 50, 4));
+        assert_eq!(pool.entries.len(), 3);
+        assert_eq!(pool.config(), PoolConfig::new(3, false, 50, 4));
+        assert_ne!(pool.config(), PoolConfig::new(2, false, 50, 4));
+    }
+}
@@ -2,17 +2,69 @@ use pyo3::prelude::*;
 use pyo3::types::PyBytes;
 use reqwest::Client;
 use std::collections::HashMap;
+use std::sync::{Mutex, OnceLock};
+use std::time::Duration;
 
 mod browser;
 mod inference;
 
+// One client per proxy (None = direct) for the whole process: reqwest pools
+// connections per host, so keep-alive sockets, TLS sessions and proxy
+// CONNECT tunnels are reused across fetches
+static HTTP_CLIENTS: OnceLock<Mutex<HashMap<Option<String>, Client>>> = OnceLock::new();
+
+// Shared browser pool, built by the first fetch_browser call; later calls
+// must pass the same settings (see browser_pool)
+static BROWSER_POOL: OnceLock<browser::BrowserPool> = OnceLock::new();
+
+fn browser_pool(config: browser::PoolConfig) -> PyResult<&'static browser::BrowserPool> {
+    let pool = BROWSER_POOL.get_or_init(|| browser::BrowserPool::new(config));
+    if pool.config() != config {
+        return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+            "browser pool already initialized with {:?}, got {:?}",
+            pool.config(),
+            config
+        )));
+    }
+    Ok(pool)
+}
+
+fn http_client(proxy: Option<String>) -> PyResult<Client> {
+    let clients = HTTP_CLIENTS.get_or_init(|| Mutex::new(HashMap::new()));
+    let mut clients = clients.lock().unwrap();
+    if let Some(client) = clients.get(&proxy) {
+        // Cheap handle clone; the connection pool itself is shared
+        return Ok(client.clone());
+    }
+
+    let mut builder = Client::builder()
+        .use_rustls_tls()
+        .pool_idle_timeout(Duration::from_secs(90))
+        .pool_max_idle_per_host(32)
+        .tcp_keepalive(Duration::from_secs(60))
+        .timeout(Duration::from_secs(30));
+    if let Some(p) = &proxy {
+        let proxy = reqwest::Proxy::all(p)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+        builder = builder.proxy(proxy);
+    }
+    let client = builder
+        .build()
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+    clients.insert(proxy, client.clone());
+    Ok(client)
+}
+
 #[pyfunction]
-fn fetch_url(py: Python, url: String, headers: Option<HashMap<String, String>>) -> PyResult<&PyAny> {
+#[pyo3(signature = (url, headers = None, proxy = None))]
+fn fetch_url(
+    py: Python,
+    url: String,
+    headers: Option<HashMap<String, String>>,
+    proxy: Option<String>,
+) -> PyResult<&PyAny> {
     pyo3_asyncio::tokio::future_into_py(py, async move {
-        let client = Client::builder()
-            .use_rustls_tls()
-            .build()
-            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+        let client = http_client(proxy)?;
 
         let mut request_builder = client.get(&url);
 
@@ -30,7 +82,8 @@ fn fetch_url(py: Python, url: String, headers: Option<HashMap<String, String>>)
         let status = response.status().as_u16();
         let wire_length = response.content_length();
         
-        // Extract headers
+        // Extract headers (HeaderName is always lowercase, so Python can do
+        // a single case-sensitive lookup per header)
         let mut headers_map = HashMap::new();
         for (key, value) in response.headers() {
             if let Ok(v) = value.to_str() {
@@ -48,13 +101,26 @@ fn fetch_url(py: Python, url: String, headers: Option<HashMap<String, String>>)
 }
 
 #[pyfunction]
-fn fetch_browser(py: Python, url: String, headless: bool) -> PyResult<&PyAny> {
+#[pyo3(signature = (url, headless, pool_size = 1, max_uses = 50, max_pages = 4))]
+fn fetch_browser(
+    py: Python,
+    url: String,
+    headless: bool,
+    pool_size: usize,
+    max_uses: u32,
+    max_pages: usize,
+) -> PyResult<&PyAny> {
+    let pool = browser_pool(browser::PoolConfig::new(
+        pool_size, headless, max_uses, max_pages,
+    ))?;
     pyo3_asyncio::tokio::future_into_py(py, async move {
-        let browser = browser::MirageBrowser::new(headless)
+        let lease = pool
+            .lease()
             .await
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
         
-        let (content, status, screenshot) = browser
+        let (content, status, screenshot) = lease
+            .browser
             .fetch_page(&url)
             .await
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
@@ -1,6 +1,9 @@
 import logging
 import asyncio
-from typing import Dict, Any, List
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Any, List, Set
+from urllib.parse import urlparse
 
 from src.agent.state import AgentState
 from src.fetching.engine import FetchingEngine
@@ -25,6 +28,8 @@ async def initialization_node(state: AgentState) -> Dict[str, Any]:
 
     # Initialize raw data collector
     collector.set_session(state["session_title"])
+    # Duplicate tracking is per session; pages from earlier crawls don't count
+    fetching_engine.reset_duplicates()
 
     updates = {
         "compressed_history": "Session started.",
@@ -59,6 +64,51 @@ async def initialization_node(state: AgentState) -> Dict[str, Any]:
     return updates
 
 
+# Queue entries examined per batch slot when spreading a batch over domains
+_BATCH_SCAN_FACTOR = 10
+
+
+@lru_cache(maxsize=8192)
+def _netloc(url: str) -> str:
+    # Batch picking, template grouping and fetcher_node all key on the host
+    try:
+        return urlparse(url).netloc
+    except ValueError:
+        return ""
+
+
+def _take_batch(queue: List[str], visited: Set[str], batch_size: int) -> List[str]:
+    """
+    Remove and return up to `batch_size` unique unvisited URLs from the front
+    of `queue`, taking one URL per domain first. fetcher_node runs distinct
+    domains concurrently but same-domain URLs back to back, so a batch spread
+    over hosts finishes sooner. Unpicked URLs keep their place in the queue;
+    visited ones are dropped.
+    """
+    batch: List[str] = []
+    while queue and not batch:
+        # Slice the window off in one go: pop(0) shifts the queue per URL
+        window = queue[: batch_size * _BATCH_SCAN_FACTOR]
+        candidates = [url for url in dict.fromkeys(window) if url not in visited]
+
+        domains = set()
+        rest = []
+        for url in candidates:
+            domain = _netloc(url)
+            if len(batch) < batch_size and domain not in domains:
+                domains.add(domain)
+                batch.append(url)
+            else:
+                rest.append(url)
+
+        # Too few distinct hosts in the window: fill up in queue order
+        fill = batch_size - len(batch)
+        batch.extend(rest[:fill])
+        queue[: len(window)] = rest[fill:]
+
+    return batch
+
+
 async def crawl_manager_node(state: AgentState) -> Dict[str, Any]:
     """Select the next batch of URLs to crawl."""
     try:
@@ -78,36 +128,19 @@ async def crawl_manager_node(state: AgentState) -> Dict[str, Any]:
         from src.core.config import config
 
         BATCH_SIZE = config.BATCH_SIZE
-        batch_urls = []
-
-        # Pop up to BATCH_SIZE unique unvisited URLs
-
-        while queue and len(batch_urls) < BATCH_SIZE:
-            next_url = queue.pop(0)
-            if next_url not in visited and next_url not in batch_urls:
-                batch_urls.append(next_url)
+        batch_urls = _take_batch(queue, visited, BATCH_SIZE)
 
         if not batch_urls:
-            # If we drained the queue but found only visited links
-            if queue:
-                return await crawl_manager_node(state)
+            # We drained the queue but found only visited links
             return {"current_urls": []}
 
         # Template Detection Logic
         # Group URLs by domain/path structure
         # For MVP, we just use the domain as the template ID
-        from urllib.parse import urlparse
-
         template_groups = state.get("template_groups", {})
 
         for url in batch_urls:
-            try:
-                domain = urlparse(url).netloc
-                if domain not in template_groups:
-                    template_groups[domain] = []
-                template_groups[domain].append(url)
-            except Exception:
-                pass
+            template_groups.setdefault(_netloc(url), []).append(url)
 
         # Check for optimization triggers (e.g. > 10 successful extractions for a template)
         # This would set optimized_templates in state
@@ -170,9 +203,22 @@ async def fetcher_node(state: AgentState) -> Dict[str, Any]:
             )
             return None, b"", True
 
-    # Run fetches concurrently
-    tasks = [fetch_single(url, i) for i, url in enumerate(urls)]
-    results = await asyncio.gather(*tasks)
+    # Same-host URLs share one rate-limit bucket and would only queue behind
+    # it, so fetch each domain's URLs back to back over a warm keep-alive
+    # connection while distinct domains run concurrently
+    by_domain: Dict[str, List[int]] = {}
+    for i, url in enumerate(urls):
+        by_domain.setdefault(_netloc(url), []).append(i)
+
+    results: List[tuple[str | None, bytes, bool]] = [(None, b"", True)] * len(urls)
+
+    async def fetch_domain(indices: List[int]):
+        for i in indices:
+            results[i] = await fetch_single(urls[i], i)
+
+    await asyncio.gather(*(fetch_domain(indices) for indices in by_domain.values()))
+    # Publish stats still held back by the engine's coalescing window
+    fetching_engine.flush_stats()
 
     # Unzip results
     contents = [r[0] for r in results]
@@ -203,38 +249,81 @@ async def relevance_analyzer_node(state: AgentState) -> Dict[str, Any]:
 
     event_bus.publish("agent_activity", status="Analyzing Relevance (AI)")
 
-    async def analyze_single(
-        url: str, content: str | None, worker_id: int
-    ) -> Dict[str, Any]:
+    results: List[Dict[str, Any]] = [
+        {"is_relevant": False, "next_urls": []} for _ in urls
+    ]
+    pages: List[tuple[int, str, str]] = []
+    for worker_id, (url, content) in enumerate(zip(urls, contents)):
         if not content:
             event_bus.publish(
                 "worker_status", worker_id=worker_id, status="Idle", progress=0
             )
-            return {"is_relevant": False, "next_urls": []}
-
+            continue
         event_bus.publish(
             "worker_status",
             worker_id=worker_id,
             status="Analyzing Relevance",
             progress=60,
         )
+        pages.append((worker_id, url, content))
 
+    async def compress(url: str, content: str) -> str:
+        # Observation Compression
+        # If content is large, compress it for relevance analysis
+        if len(content) <= 20000:
+            return content
         try:
-            # Observation Compression
-            # If content is large, compress it for relevance analysis
-            analysis_content = content
-            if len(content) > 20000:
-                analysis_content = await context_compressor.compress_observation(
-                    content, state["objective"]
-                )
-                logger.info(
-                    f"Compressed content for {url}: {len(content)} -> {len(analysis_content)}"
-                )
+            compressed = await context_compressor.compress_observation(
+                content, state["objective"]
+            )
+        except Exception as e:
+            # Score this page on a truncated copy rather than dropping it
+            logger.error(f"Error compressing content for {url}: {e}")
+            return content[:20000]
+        logger.info(
+            f"Compressed content for {url}: {len(content)} -> {len(compressed)}"
+        )
+        return compressed
 
-            analysis = await gemini_client.analyze_relevance(
-                state["objective"], analysis_content, url
+    async def score_batch() -> List[Dict[str, Any]]:
+        analysis_contents = await asyncio.gather(
+            *(compress(url, content) for _, url, content in pages)
+        )
+        # One request scores the whole batch instead of one per page
+        try:
+            return await gemini_client.analyze_relevance_batch(
+                state["objective"],
+                [(url, text) for (_, url, _), text in zip(pages, analysis_contents)],
             )
+        except Exception as e:
+            logger.error(f"Error analyzing batch relevance: {e}")
+            return [{"is_relevant": False, "next_urls": []} for _ in pages]
+
+    async def find_endpoints(url: str, content: str) -> List[str]:
+        # API Endpoint Discovery reads the original content (it looks for
+        # specific patterns)
+        try:
+            return await gemini_client.analyze_api_endpoints(content, url)
+        except Exception as e:
+            logger.error(f"Error finding API endpoints on {url}: {e}")
+            return []
 
+    if pages:
+        # Endpoint discovery runs alongside the relevance request; both
+        # helpers handle their own errors so one bad page only loses itself
+        analyses, endpoint_lists = await asyncio.gather(
+            score_batch(),
+            asyncio.gather(
+                *(find_endpoints(url, content) for _, url, content in pages)
+            ),
+        )
+
+        for (i, url, _), analysis, api_endpoints in zip(
+            pages, analyses, endpoint_lists
+        ):
+            if not isinstance(analysis, dict):
+                logger.warning(f"Ignoring malformed relevance result for {url}")
+                analysis = {"is_relevant": False, "next_urls": []}
             # Determine relevance based on score > 50 (lowered from 60)
             score = analysis.get("relevance_score", 0)
             analysis["is_relevant"] = score > 50
@@ -245,22 +334,13 @@ async def relevance_analyzer_node(state: AgentState) -> Dict[str, Any]:
             if analysis["is_relevant"]:
                 logger.info(f"Page {url} is relevant (Score: {score})")
 
-            # API Endpoint Discovery (use full content or truncated, but not summary)
-            # We use the original content for this as it looks for specific patterns
-            api_endpoints = await gemini_client.analyze_api_endpoints(content, url)
             if api_endpoints:
                 logger.info(f"Discovered {len(api_endpoints)} API endpoints on {url}")
                 # Add API endpoints to next_urls
                 current_next_urls = analysis.get("next_urls", [])
                 analysis["next_urls"] = list(set(current_next_urls + api_endpoints))
 
-            return analysis
-        except Exception as e:
-            logger.error(f"Error analyzing {url}: {e}")
-            return {"is_relevant": False, "next_urls": []}
-
-    tasks = [analyze_single(u, c, i) for i, (u, c) in enumerate(zip(urls, contents))]
-    results = await asyncio.gather(*tasks)
+            results[i] = analysis
 
     relevant_flags = [r.get("is_relevant", False) for r in results]
     batch_next_urls = [r.get("next_urls", []) for r in results]
@@ -317,6 +397,17 @@ async def extractor_node(state: AgentState) -> Dict[str, Any]:
             )
             return []
 
+        # Duplicates of an already fetched page yield the same data
+        if url in fetching_engine.near_duplicate_urls:
+            original = fetching_engine.near_duplicate_urls[url]
+            logger.info(
+                f"Skipping extraction for {url}: duplicate of already fetched {original}"
+            )
+            event_bus.publish(
+                "worker_status", worker_id=worker_id, status="Idle", progress=0
+            )
+            return []
+
         event_bus.publish(
             "worker_status", worker_id=worker_id, status="Fast Extracting", progress=80
         )
@@ -508,20 +599,23 @@ async def refinement_node(state: AgentState) -> Dict[str, Any]:
         current_queue = state.get("url_queue", [])
         visited = state.get("visited_urls", set())
 
-        # Flatten the list of lists
-        all_new_urls = []
-        for url_list in batch_next_urls:
-            all_new_urls.extend(url_list)
-
-        # Filter duplicates and visited
-        unique_new_urls = []
-        for url in all_new_urls:
-            if (
-                url not in visited
-                and url not in current_queue
-                and url not in unique_new_urls
-            ):
-                unique_new_urls.append(url)
+        # Flatten and drop repeats in one ordered pass, then filter visited
+        # and already-queued URLs with set lookups
+        candidates = dict.fromkeys(chain.from_iterable(batch_next_urls))
+        queued = set(current_queue)
+        unique_new_urls = [
+            url for url in candidates if url not in visited and url not in queued
+        ]
+
+        # Backpressure: keep the pending queue bounded on link-heavy crawls
+        from src.core.config import config
+
+        room = max(0, config.MAX_QUEUE_SIZE - len(current_queue))
+        if len(unique_new_urls) > room:
+            logger.info(
+                f"Queue full; dropping {len(unique_new_urls) - room} discovered URLs."
+            )
+            unique_new_urls = unique_new_urls[:room]
 
         if unique_new_urls:
             logger.info(f"Adding {len(unique_new_urls)} new URLs to queue.")
@@ -1,7 +1,8 @@
+import asyncio
 import json
 import logging
 import base64
-from typing import Any, Dict, List, Type, Optional
+from typing import Any, Dict, List, Tuple, Type, Optional
 
 import google.generativeai as genai
 from openai import AsyncOpenAI
@@ -15,6 +16,7 @@ from src.ai.prompts import (
     get_title_generation_prompt,
     get_schema_generation_prompt,
     get_relevance_analysis_prompt,
+    get_batch_relevance_analysis_prompt,
     get_extraction_prompt,
 )
 
@@ -109,6 +111,26 @@ class GeminiClient:
             logger.error(f"OpenAI fallback failed: {e}")
             raise
 
+    async def _generate_fast(
+        self, prompt: str, task: str, system_instruction: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Run a prompt on the fast model, falling back to OpenAI.
+        Returns None if both providers fail.
+        """
+        try:
+            response = await self.fast_model.generate_content_async(prompt)
+            return response.text
+        except Exception as e:
+            logger.warning(f"Gemini {task} failed: {e}. Trying fallback.")
+        try:
+            return await self._call_openai(
+                prompt, model_type="fast", system_instruction=system_instruction
+            )
+        except Exception as e:
+            logger.error(f"Fallback {task} failed: {e}")
+            return None
+
     def set_model(self, model_name: str):
         """Switch the active Gemini model (Orchestrator)."""
         self.model_name = model_name
@@ -122,33 +144,22 @@ class GeminiClient:
         """
         prompt = get_seed_analysis_prompt(url, content)
 
-        response_text = ""
-        try:
-            response = await self.fast_model.generate_content_async(prompt)
-            response_text = response.text
-        except Exception as e:
-            logger.warning(f"Gemini seed analysis failed: {e}. Trying fallback.")
-            try:
-                response_text = await self._call_openai(
-                    prompt,
-                    model_type="fast",
-                    system_instruction=self.fast_agent_instruction,
-                )
-            except Exception as e2:
-                logger.error(f"Fallback seed analysis failed: {e2}")
-                return {
-                    "summary": "Could not analyze page.",
-                    "suggestions": ["Extract all text", "Extract links", "Custom..."],
-                }
+        response_text = await self._generate_fast(
+            prompt, "seed analysis", self.fast_agent_instruction
+        )
+
+        fallback = {
+            "summary": "Could not analyze page.",
+            "suggestions": ["Extract all text", "Extract links", "Custom..."],
+        }
+        if response_text is None:
+            return fallback
 
         try:
             cleaned_text = self._clean_json_response(response_text)
             return json.loads(cleaned_text)
         except Exception:
-            return {
-                "summary": "Could not analyze page.",
-                "suggestions": ["Extract all text", "Extract links", "Custom..."],
-            }
+            return fallback
 
     async def generate_title(self, objective: str, content: str) -> str:
         """
@@ -157,16 +168,10 @@ class GeminiClient:
         """
         prompt = get_title_generation_prompt(objective, content)
 
-        try:
-            response = await self.fast_model.generate_content_async(prompt)
-            return response.text.strip()
-        except Exception as e:
-            logger.warning(f"Gemini title generation failed: {e}. Trying fallback.")
-            try:
-                return await self._call_openai(prompt, model_type="fast")
-            except Exception as e2:
-                logger.error(f"Fallback title generation failed: {e2}")
-                return "Untitled Session"
+        response_text = await self._generate_fast(prompt, "title generation")
+        if response_text is None:
+            return "Untitled Session"
+        return response_text.strip()
 
     async def generate_schema(self, objective: str) -> Type[BaseModel]:
         """
@@ -206,21 +211,11 @@ class GeminiClient:
         """
         prompt = get_relevance_analysis_prompt(objective, content, url)
 
-        response_text = ""
-        try:
-            response = await self.fast_model.generate_content_async(prompt)
-            response_text = response.text
-        except Exception as e:
-            logger.warning(f"Gemini relevance analysis failed: {e}. Trying fallback.")
-            try:
-                response_text = await self._call_openai(
-                    prompt,
-                    model_type="fast",
-                    system_instruction=self.fast_agent_instruction,
-                )
-            except Exception as e2:
-                logger.error(f"Fallback relevance analysis failed: {e2}")
-                return {"relevance_score": 0, "reason": "Error", "next_urls": []}
+        response_text = await self._generate_fast(
+            prompt, "relevance analysis", self.fast_agent_instruction
+        )
+        if response_text is None:
+            return {"relevance_score": 0, "reason": "Error", "next_urls": []}
 
         try:
             cleaned_text = self._clean_json_response(response_text)
@@ -228,6 +223,55 @@ class GeminiClient:
         except Exception:
             return {"relevance_score": 0, "reason": "Error", "next_urls": []}
 
+    async def analyze_relevance_batch(
+        self, objective: str, pages: List[Tuple[str, str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Score a batch of (url, content) pages with a single request.
+        Uses the fast model. Falls back to one call per page if the batched
+        reply cannot be matched up with the pages.
+        """
+        if len(pages) <= 1:
+            return [
+                await self.analyze_relevance(objective, content, url)
+                for url, content in pages
+            ]
+
+        prompt = get_batch_relevance_analysis_prompt(objective, pages)
+
+        response_text = await self._generate_fast(
+            prompt, "batch relevance analysis", self.fast_agent_instruction
+        )
+        if response_text is None:
+            return [
+                {"relevance_score": 0, "reason": "Error", "next_urls": []}
+                for _ in pages
+            ]
+
+        try:
+            results = json.loads(self._clean_json_response(response_text))
+        except Exception as e:
+            logger.warning(f"Could not parse batch relevance reply: {e}")
+            results = None
+        if (
+            isinstance(results, list)
+            and len(results) == len(pages)
+            and all(isinstance(r, dict) for r in results)
+        ):
+            return results
+
+        logger.warning(
+            "Batch relevance reply did not match the pages; retrying per page."
+        )
+        return list(
+            await asyncio.gather(
+                *(
+                    self.analyze_relevance(objective, content, url)
+                    for url, content in pages
+                )
+            )
+        )
+
     async def analyze_api_endpoints(self, content: str, url: str) -> List[str]:
         """
         Analyze page content to find potential API endpoints.
@@ -248,17 +292,9 @@ class GeminiClient:
         {content[:50000]}
         """
 
-        response_text = ""
-        try:
-            response = await self.fast_model.generate_content_async(prompt)
-            response_text = response.text
-        except Exception as e:
-            logger.warning(f"Gemini API analysis failed: {e}. Trying fallback.")
-            try:
-                response_text = await self._call_openai(prompt, model_type="fast")
-            except Exception as e2:
-                logger.error(f"Fallback API analysis failed: {e2}")
-                return []
+        response_text = await self._generate_fast(prompt, "API analysis")
+        if response_text is None:
+            return []
 
         try:
             cleaned_text = self._clean_json_response(response_text)
@@ -323,17 +359,9 @@ class GeminiClient:
         </content>
         """
 
-        response_text = ""
-        try:
-            response = await self.fast_model.generate_content_async(prompt)
-            response_text = response.text
-        except Exception as e:
-            logger.warning(f"Fast extraction failed: {e}. Trying fallback.")
-            try:
-                response_text = await self._call_openai(prompt, model_type="fast")
-            except Exception as e2:
-                logger.error(f"Fallback fast extraction failed: {e2}")
-                return []
+        response_text = await self._generate_fast(prompt, "fast extraction")
+        if response_text is None:
+            return []
 
         try:
             cleaned_text = self._clean_json_response(response_text)
@@ -1,3 +1,5 @@
+from typing import List, Tuple
+
 ORCHESTRATOR_INSTRUCTION = """
 You are Scram Orchestrator, an advanced Autonomous Data Acquisition Architect designed for Machine Learning pipelines.
 
@@ -135,6 +137,36 @@ def get_relevance_analysis_prompt(objective: str, content: str, url: str) -> str
         """
 
 
+def get_batch_relevance_analysis_prompt(
+    objective: str, pages: List[Tuple[str, str]]
+) -> str:
+    documents = "\n".join(
+        f"""
+        <page index="{i}" url="{url}">
+        {content[:5000]}... (truncated)
+        </page>"""
+        for i, (url, content) in enumerate(pages)
+    )
+    return f"""
+        Objective: "{objective}"
+        {documents}
+
+        For EACH page above, in the same order:
+        1. Analyze if this page is relevant to the objective. Assign a relevance score from 0 to 100.
+        2. If relevant, explain why briefly.
+        3. Identify up to 5 most relevant links to follow next.
+
+        Return a JSON array with exactly {len(pages)} objects, one per page, in page order:
+        [
+            {{
+                "relevance_score": integer,
+                "reason": "string",
+                "next_urls": ["url1", "url2"]
+            }}
+        ]
+        """
+
+
 def get_extraction_prompt(schema_json: str, content: str) -> str:
     return f"""
         Extract data from the following content matching this schema:
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 import asyncio
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     type: str
     payload: Dict[str, Any]
@@ -13,12 +13,32 @@ class EventBus:
     def __init__(self):
         self.subscribers: List[Callable[[Event], None]] = []
         self.loop = None
+        # Precomputed at subscribe time so publish doesn't probe every callback
+        self._has_async = False
 
     def subscribe(self, callback: Callable[[Event], None]):
         self.subscribers.append(callback)
+        self._has_async = self._has_async or asyncio.iscoroutinefunction(callback)
+
+    def unsubscribe(self, callback: Callable[[Event], None]):
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+            self._has_async = any(
+                asyncio.iscoroutinefunction(cb) for cb in self.subscribers
+            )
 
     def publish(self, event_type: str, **kwargs):
+        # Fast path: headless/CLI runs have no subscribers
+        if not self.subscribers:
+            return
+
         event = Event(type=event_type, payload=kwargs)
+
+        if not self._has_async:
+            for callback in self.subscribers:
+                callback(event)
+            return
+
         for callback in self.subscribers:
             # If callback is a coroutine, schedule it
             if asyncio.iscoroutinefunction(callback):
@@ -7,6 +7,9 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Characters hashed from each end of a large body
+_FINGERPRINT_CHUNK = 16384
+
 
 class CacheManager:
     def __init__(self, db_path: str = "scram_data/cache.db"):
@@ -60,11 +63,16 @@ class CacheManager:
         content: str,
         etag: Optional[str] = None,
         last_modified: Optional[str] = None,
+        content_hash: Optional[str] = None,
     ):
-        """Update or insert a cache entry."""
+        """
+        Update or insert a cache entry.
+        The content hash is computed only when neither a precomputed hash
+        nor ETag/Last-Modified validators are supplied.
+        """
         try:
-            # Calculate content hash
-            content_hash = hashlib.md5(content.encode("utf-8")).hexdigest()
+            if content_hash is None and not (etag or last_modified):
+                content_hash = self.get_content_hash(content)
 
             with self.conn:
                 self.conn.execute(
@@ -79,7 +87,19 @@ class CacheManager:
             logger.error(f"Cache write error for {url}: {e}")
 
     def get_content_hash(self, content: str) -> str:
-        return hashlib.md5(content.encode("utf-8")).hexdigest()
+        """
+        Fingerprint content for change detection.
+        Large bodies hash only their length plus the first and last
+        chunks instead of the full text.
+        """
+        if len(content) <= 2 * _FINGERPRINT_CHUNK:
+            sample = content
+        else:
+            sample = (
+                f"{len(content)}:"
+                f"{content[:_FINGERPRINT_CHUNK]}{content[-_FINGERPRINT_CHUNK:]}"
+            )
+        return hashlib.blake2b(sample.encode("utf-8"), digest_size=16).hexdigest()
 
     def close(self):
         if self.conn:
@@ -1,17 +1,140 @@
 import asyncio
 import csv
+import hashlib
 import json
 import logging
+import queue
+import re
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
 from src.data.graph import KnowledgeGraph
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_UNSAFE_TITLE_CHARS = re.compile(r"[^\w -]")
+
+# Rows per executemany batch for the SQLite export
+_SQLITE_CHUNK_ROWS = 1000
+
+# Arrow JSON reader block size (per-thread parse unit)
+_JSONL_BLOCK_SIZE = 1 << 20
+
+# Knowledge graph entity type rules, checked in order: any matching key wins
+_ENTITY_RULES = (
+    (frozenset({"product_name", "price"}), "Product"),
+    (frozenset({"article_body"}), "Article"),
+)
+
+
+def _infer_entity_type(item: Dict[str, Any]) -> str:
+    keys = item.keys()
+    return next(
+        (etype for rule_keys, etype in _ENTITY_RULES if not rule_keys.isdisjoint(keys)),
+        "Entity",
+    )
+
+
+@dataclass(frozen=True)
+class SessionPaths:
+    """Prebuilt filesystem layout for a single session."""
+
+    session_dir: Path
+    data_dir: Path
+    images_dir: Path
+    raw_jsonl: Path
+    raw_csv: Path
+
+
+def _read_jsonl(path: Path) -> Tuple[pd.DataFrame, Any]:
+    """
+    Load a JSONL file via PyArrow's streaming, multithreaded reader.
+    Returns the DataFrame along with the source Arrow table (row-aligned
+    with the frame's index) so exports can skip a pandas -> Arrow pass.
+    Falls back to pandas (and no table) when PyArrow is missing or the
+    rows have inconsistent types that Arrow cannot unify.
+    """
+    try:
+        import pyarrow.json as paj
+        import pyarrow.types as pat
+
+        table = paj.read_json(
+            str(path), read_options=paj.ReadOptions(block_size=_JSONL_BLOCK_SIZE)
+        )
+    except ImportError:
+        return pd.read_json(path, lines=True), None
+    except ValueError as e:
+        logger.debug(f"Arrow JSONL read failed, falling back to pandas: {e}")
+        return pd.read_json(path, lines=True), None
+
+    # Arrow turns nested lists into numpy arrays; keep them as plain
+    # Python objects so downstream dict/list handling still applies.
+    df = pd.DataFrame(
+        {
+            field.name: (
+                table.column(i).to_pylist()
+                if pat.is_nested(field.type)
+                else table.column(i).to_pandas()
+            )
+            for i, field in enumerate(table.schema)
+        }
+    )
+    return df, table
+
+
+def _drop_duplicates(df: pd.DataFrame, subset: List[str]) -> pd.DataFrame:
+    """
+    Keep the first row for each distinct subset key using Arrow's
+    multithreaded hash aggregation. Falls back to pandas when PyArrow is
+    missing or a key column has a type Arrow can't group on.
+    """
+    try:
+        import numpy as np
+        import pyarrow as pa
+
+        keys = pa.Table.from_pandas(df[subset], preserve_index=False)
+        keys = keys.append_column("__row", pa.array(np.arange(len(df))))
+        first_rows = keys.group_by(subset).aggregate([("__row", "min")])
+        positions = np.sort(first_rows["__row_min"].to_numpy())
+    except (ImportError, ValueError, TypeError, NotImplementedError) as e:
+        logger.debug(f"Arrow deduplication unavailable, using pandas: {e}")
+        return df.drop_duplicates(subset=subset)
+
+    return df.iloc[positions]
+
+
+def _json_default(obj: Any) -> Any:
+    # ISO 8601 for datetime-likes orjson doesn't handle natively (pd.Timestamp)
+    # and for the stdlib fallback
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any, newline: bool = False) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_APPEND_NEWLINE if newline else 0,
+        )
+    encoded = json.dumps(obj, separators=(",", ":"), default=_json_default).encode(
+        "utf-8"
+    )
+    return encoded + b"\n" if newline else encoded
+
 
 class DataExporter:
     def __init__(self, base_dir: str = "scram_data"):
@@ -19,24 +142,43 @@ class DataExporter:
         self.base_dir.mkdir(exist_ok=True)
         self.graph = KnowledgeGraph()
         self._lock = asyncio.Lock()
+        # Session title -> resolved paths (directories are created once)
+        self._session_paths: Dict[str, SessionPaths] = {}
+        # Raw batches are written by a dedicated background thread
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_start_lock = threading.Lock()
+        # Content-addressed screenshot files already written (writer thread only)
+        self._seen_screenshots: Set[Path] = set()
+
+    def _get_session_paths(self, session_title: str) -> SessionPaths:
+        """Resolve and create the session directory layout, memoized per title."""
+        paths = self._session_paths.get(session_title)
+        if paths is not None:
+            return paths
 
-    def _get_session_dir(self, session_title: str) -> Path:
         # Sanitize title
         safe_title = (
-            "".join(
-                [
-                    c if c.isalnum() or c in (" ", "-", "_") else "_"
-                    for c in session_title
-                ]
-            )
-            .strip()
-            .replace(" ", "_")
+            _UNSAFE_TITLE_CHARS.sub("_", session_title).strip().replace(" ", "_")
         )
         session_dir = self.base_dir / safe_title
-        session_dir.mkdir(exist_ok=True)
-        (session_dir / "data").mkdir(exist_ok=True)
-        (session_dir / "logs").mkdir(exist_ok=True)
-        return session_dir
+        data_dir = session_dir / "data"
+        images_dir = session_dir / "images"
+        for directory in (data_dir, session_dir / "logs", images_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+
+        paths = SessionPaths(
+            session_dir=session_dir,
+            data_dir=data_dir,
+            images_dir=images_dir,
+            raw_jsonl=data_dir / "raw_data.jsonl",
+            raw_csv=data_dir / "raw_data.csv",
+        )
+        self._session_paths[session_title] = paths
+        return paths
+
+    def _get_session_dir(self, session_title: str) -> Path:
+        return self._get_session_paths(session_title).session_dir
 
     def save_config(self, session_title: str, config_data: Dict[str, Any]):
         """Save session configuration and metadata."""
@@ -53,49 +195,79 @@ class DataExporter:
         data: List[Dict[str, Any]],
         screenshots: Optional[List[bytes]] = None,
     ):
-        """Save a batch of data to raw storage (JSONL/CSV) immediately."""
+        """
+        Queue a batch of data for raw storage (JSONL/CSV).
+        Returns once the batch is enqueued; call flush() to wait for the write.
+        """
         if not data:
             return
 
-        session_dir = self._get_session_dir(session_title)
-        data_dir = session_dir / "data"
-        images_dir = session_dir / "images"
-        images_dir.mkdir(exist_ok=True)
+        paths = self._get_session_paths(session_title)
 
-        # Update Knowledge Graph (In-memory, fast enough)
-        for i, item in enumerate(data):
-            # Infer entity type
-            entity_type = "Entity"
-            if "product_name" in item or "price" in item:
-                entity_type = "Product"
-            elif "article_body" in item:
-                entity_type = "Article"
-            self.graph.add_entity(entity_type, item)
-
-        # Offload file I/O to thread
-        await asyncio.to_thread(
-            self._write_batch_to_disk, data, screenshots, data_dir, images_dir
-        )
+        # Hand the graph update and file I/O to the writer thread
+        self._ensure_writer()
+        self._write_queue.put_nowait((data, screenshots, paths))
+
+    def _ensure_writer(self):
+        """Start the background writer thread if it is not running."""
+        with self._writer_start_lock:
+            if self._writer_thread is None or not self._writer_thread.is_alive():
+                self._writer_thread = threading.Thread(
+                    target=self._writer_loop, name="scram-export-writer", daemon=True
+                )
+                self._writer_thread.start()
+
+    def _writer_loop(self):
+        """Drain queued batches to disk until the stop sentinel arrives."""
+        while True:
+            job = self._write_queue.get()
+            try:
+                if job is None:
+                    return
+                data, screenshots, paths = job
+                # Update Knowledge Graph (In-memory)
+                self.graph.add_entities(
+                    (_infer_entity_type(item), item) for item in data
+                )
+                self._write_batch_to_disk(data, screenshots, paths)
+            except Exception as e:
+                logger.error(f"Background batch write failed: {e}")
+            finally:
+                self._write_queue.task_done()
+
+    def flush(self):
+        """Block until every queued batch has been written to disk."""
+        self._write_queue.join()
+
+    def close(self):
+        """Flush pending batches and stop the writer thread."""
+        thread = self._writer_thread
+        if thread is None or not thread.is_alive():
+            return
+        self._write_queue.put(None)
+        thread.join()
+        self._writer_thread = None
 
     def _write_batch_to_disk(
         self,
         data: List[Dict[str, Any]],
         screenshots: Optional[List[bytes]],
-        data_dir: Path,
-        images_dir: Path,
+        paths: SessionPaths,
     ):
         """Synchronous file writing logic."""
         # Save Screenshots
         for i, item in enumerate(data):
             if screenshots and i < len(screenshots) and screenshots[i]:
-                import hashlib
-
-                img_hash = hashlib.md5(screenshots[i]).hexdigest()
+                img_hash = hashlib.blake2b(screenshots[i], digest_size=16).hexdigest()
                 img_filename = f"{img_hash}.png"
-                img_path = images_dir / img_filename
+                img_path = paths.images_dir / img_filename
 
-                with open(img_path, "wb") as f:
-                    f.write(screenshots[i])
+                # Filenames are content-addressed, so identical bytes never need rewriting
+                if img_path not in self._seen_screenshots:
+                    if not img_path.exists():
+                        with open(img_path, "wb") as f:
+                            f.write(screenshots[i])
+                    self._seen_screenshots.add(img_path)
 
                 # Update metadata (Note: modifying dict in list is safe here as it's passed by ref)
                 if "_metadata" not in item:
@@ -104,28 +276,38 @@ class DataExporter:
 
         # Append to JSONL
         try:
-            with open(data_dir / "raw_data.jsonl", "a", encoding="utf-8") as f:
-                for item in data:
-                    f.write(json.dumps(item) + "\n")
+            payload = b"".join(_dumps(item, newline=True) for item in data)
+            with open(paths.raw_jsonl, "ab") as f:
+                f.write(payload)
         except Exception as e:
             logger.error(f"Failed to save raw JSONL: {e}")
 
         # Append to CSV
         try:
-            filepath = data_dir / "raw_data.csv"
+            filepath = paths.raw_csv
             file_exists = filepath.exists()
-            keys = list(data[0].keys())
-
-            with open(filepath, "a", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=keys)
-                if not file_exists:
-                    writer.writeheader()
-                for item in data:
-                    row = {k: item.get(k, "") for k in keys}
-                    writer.writerow(row)
+            keys = self._csv_header(filepath) if file_exists else None
+            if not keys:
+                file_exists = False
+                keys = list(data[0].keys())
+
+            # Vectorized append; columns follow the existing header so rows stay aligned
+            pd.DataFrame(data, columns=keys, dtype=object).to_csv(
+                filepath,
+                mode="a",
+                header=not file_exists,
+                index=False,
+                encoding="utf-8",
+            )
         except Exception as e:
             logger.error(f"Failed to save raw CSV: {e}")
 
+    @staticmethod
+    def _csv_header(filepath: Path) -> List[str]:
+        """Read the column names from the first line of an existing CSV."""
+        with open(filepath, newline="", encoding="utf-8") as f:
+            return next(csv.reader(f), [])
+
     def _export_structural_compressed(self, df: pd.DataFrame, filepath: str):
         """
         Export data in a structurally compressed format.
@@ -139,7 +321,7 @@ class DataExporter:
 
         # Extract values as list of lists
         # Handle NaN/None by converting to None (which becomes null in JSON)
-        data_values = df.where(pd.notnull(df), None).values.tolist()
+        data_values = df.to_numpy(dtype=object, na_value=None).tolist()
 
         compressed_payload = {
             "schema": {
@@ -150,8 +332,92 @@ class DataExporter:
             "metadata": {"count": len(df), "compression": "structural-anchor"},
         }
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(compressed_payload, f, separators=(",", ":"))
+        with open(filepath, "wb") as f:
+            f.write(_dumps(compressed_payload))
+
+    def _to_arrow(self, df: pd.DataFrame):
+        """Convert the clean DataFrame to an Arrow table, or None if unavailable."""
+        try:
+            import pyarrow as pa
+        except ImportError:
+            logger.warning("PyArrow not installed. Using pandas writers.")
+            return None
+
+        try:
+            return pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            # Mixed-type object columns can't be expressed as a single Arrow type
+            logger.warning(f"Arrow conversion failed, using pandas writers: {e}")
+            return None
+
+    def _export_parquet(self, df: pd.DataFrame, table, filepath: str):
+        if table is None:
+            try:
+                df.to_parquet(filepath, compression="zstd")
+            except ImportError:
+                logger.warning("PyArrow not installed. Skipping Parquet export.")
+            return
+
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, filepath, compression="zstd")
+
+    def _export_jsonl(self, df: pd.DataFrame, table, filepath: str):
+        if table is None:
+            df.to_json(filepath, orient="records", lines=True)
+            return
+
+        with open(filepath, "wb") as f:
+            for batch in table.to_batches(max_chunksize=10_000):
+                f.write(
+                    b"".join(_dumps(row, newline=True) for row in batch.to_pylist())
+                )
+
+    def _export_csv(self, df: pd.DataFrame, table, filepath: str):
+        if table is not None:
+            import pyarrow.types as pat
+
+            # Arrow's CSV writer can't encode nested (list/struct) columns
+            if not any(pat.is_nested(field.type) for field in table.schema):
+                import pyarrow.csv as pac
+
+                pac.write_csv(table, filepath)
+                return
+
+        df.to_csv(filepath, index=False)
+
+    def _export_sqlite(self, df: pd.DataFrame, db_path: Path):
+        # Convert dict/list values to JSON strings for SQLite; other columns
+        # are shared with the source frame rather than copied.
+        nested = {}
+        for col in df.columns:
+            if df[col].dtype != object:
+                continue
+            mask = df[col].map(lambda x: isinstance(x, (dict, list)))
+            if mask.any():
+                encoded = df[col].copy()
+                encoded[mask] = [_dumps(v).decode("utf-8") for v in df[col][mask]]
+                nested[col] = encoded
+        df_sqlite = df.assign(**nested) if nested else df
+
+        conn = sqlite3.connect(db_path)
+        try:
+            # Bulk-load settings: WAL journal, fewer fsyncs, in-memory temp data
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            # pandas' sqlite3 path inserts each chunk with executemany
+            df_sqlite.to_sql(
+                "extracted_data",
+                conn,
+                if_exists="replace",
+                index=False,
+                chunksize=_SQLITE_CHUNK_ROWS,
+            )
+            # Checkpoint and drop the -wal/-shm files so the export is one file
+            conn.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            conn.close()
 
     async def finalize_session(self, session_title: str):
         """Read raw data, deduplicate, normalize, and export to all formats."""
@@ -160,8 +426,14 @@ class DataExporter:
 
     def _finalize_session_sync(self, session_title: str):
         """Synchronous implementation of finalize_session."""
-        session_dir = self._get_session_dir(session_title)
-        raw_jsonl = session_dir / "data" / "raw_data.jsonl"
+        # Stop the writer once every queued batch has hit disk, so no
+        # knowledge graph update can land while the exports below read it.
+        # A later save_batch starts a fresh writer.
+        self.close()
+
+        paths = self._get_session_paths(session_title)
+        session_dir = paths.session_dir
+        raw_jsonl = paths.raw_jsonl
 
         if not raw_jsonl.exists():
             logger.warning(f"No data found for session {session_title} to finalize.")
@@ -171,8 +443,7 @@ class DataExporter:
 
         # Load Data
         try:
-            # Use pandas to read JSONL
-            df = pd.read_json(raw_jsonl, lines=True)
+            df, raw_table = _read_jsonl(raw_jsonl)
         except ValueError as e:
             logger.error(f"Failed to read JSONL data for finalization: {e}")
             return
@@ -193,7 +464,7 @@ class DataExporter:
 
         try:
             if subset:
-                df = df.drop_duplicates(subset=subset)
+                df = _drop_duplicates(df, subset)
             else:
                 # Fallback exact match on hashable columns
                 hashable_cols = [
@@ -204,7 +475,7 @@ class DataExporter:
                     )
                 ]
                 if hashable_cols:
-                    df = df.drop_duplicates(subset=hashable_cols)
+                    df = _drop_duplicates(df, hashable_cols)
                 else:
                     df = df.loc[df.astype(str).drop_duplicates().index]
         except Exception as e:
@@ -231,66 +502,57 @@ class DataExporter:
         logger.info(f"Final Count: {initial_count} -> {len(df)} items")
 
         # Export Paths
-        export_base = session_dir / "data" / "clean_data"
-
-        # 1. JSONL
-        try:
-            df.to_json(str(export_base) + ".jsonl", orient="records", lines=True)
-        except Exception as e:
-            logger.error(f"Failed to export clean JSONL: {e}")
-
-        # 2. CSV
-        try:
-            df.to_csv(str(export_base) + ".csv", index=False)
-        except Exception as e:
-            logger.error(f"Failed to export clean CSV: {e}")
-
-        # 3. Parquet (Compressed)
-        try:
-            df.to_parquet(str(export_base) + ".parquet", compression="zstd")
-        except ImportError:
-            logger.warning("PyArrow not installed. Skipping Parquet export.")
-        except Exception as e:
-            logger.error(f"Parquet export failed: {e}")
-
-        # 4. Structural-Anchor Compression (Schema-Data JSON)
-        try:
-            self._export_structural_compressed(
-                df, str(export_base) + "_compressed.json"
-            )
-        except Exception as e:
-            logger.error(f"Structural compression export failed: {e}")
-
-        # 5. SQLite
-        try:
-            db_path = session_dir / "data" / "database.sqlite"
-            conn = sqlite3.connect(db_path)
-
-            # Convert dict/list columns to JSON strings for SQLite
-            df_sqlite = df.copy()
-            for col in df_sqlite.columns:
-                # Check if column contains dicts or lists
-                sample = (
-                    df_sqlite[col].dropna().iloc[0]
-                    if not df_sqlite[col].dropna().empty
-                    else None
-                )
-                if isinstance(sample, (dict, list)):
-                    df_sqlite[col] = df_sqlite[col].apply(
-                        lambda x: json.dumps(x) if x is not None else None
-                    )
-
-            df_sqlite.to_sql("extracted_data", conn, if_exists="replace", index=False)
-            conn.close()
-        except Exception as e:
-            logger.error(f"SQLite export failed: {e}")
+        export_base = paths.data_dir / "clean_data"
+
+        # One columnar table feeds the Parquet, JSONL and CSV writers. When the
+        # raw file was read by Arrow, select the surviving rows from it
+        # (the frame's index is still the row position) instead of converting
+        # the DataFrame back.
+        if raw_table is not None:
+            table = raw_table.take(df.index.to_numpy())
+        else:
+            table = self._to_arrow(df)
+
+        # Each writer touches a distinct file, so they can run concurrently
+        exports = {
+            "Parquet": (
+                self._export_parquet,
+                df,
+                table,
+                str(export_base) + ".parquet",
+            ),
+            "Clean JSONL": (
+                self._export_jsonl,
+                df,
+                table,
+                str(export_base) + ".jsonl",
+            ),
+            "Clean CSV": (self._export_csv, df, table, str(export_base) + ".csv"),
+            # Structural-Anchor Compression (Schema-Data JSON)
+            "Structural compression": (
+                self._export_structural_compressed,
+                df,
+                str(export_base) + "_compressed.json",
+            ),
+            "SQLite": (self._export_sqlite, df, paths.data_dir / "database.sqlite"),
+            # Knowledge Graph (GraphML)
+            "GraphML": (
+                self.graph.export_graphml,
+                str(paths.data_dir / "knowledge_graph.graphml"),
+            ),
+        }
 
-        # 5. Knowledge Graph (GraphML)
-        try:
-            graph_path = session_dir / "data" / "knowledge_graph.graphml"
-            self.graph.export_graphml(str(graph_path))
-        except Exception as e:
-            logger.error(f"GraphML export failed: {e}")
+        with ThreadPoolExecutor(
+            max_workers=len(exports), thread_name_prefix="scram-export"
+        ) as pool:
+            futures = {
+                pool.submit(fn, *args): name for name, (fn, *args) in exports.items()
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"{futures[future]} export failed: {e}")
 
         logger.info(f"Session finalized. Exports available in {session_dir}/data/")
 
@@ -1,11 +1,20 @@
 import logging
+import sys
 import uuid
-from typing import Any, Dict, List, Set, Tuple, Optional
+from typing import Any, Dict, Iterable, List, Set, Tuple, Optional
 import json
 import networkx as nx
 
 logger = logging.getLogger(__name__)
 
+# Identity keys to probe, in priority order, for each entity type
+_DEFAULT_KEY_PRIORITY = ("url", "id", "isbn", "sku", "email")
+_TYPE_KEY_PRIORITY: Dict[str, Tuple[str, ...]] = {
+    "Product": ("sku", "url", "id"),
+    "Article": ("url", "id"),
+    "Entity": _DEFAULT_KEY_PRIORITY,
+}
+
 
 class KnowledgeGraph:
     def __init__(self):
@@ -34,6 +43,37 @@ class KnowledgeGraph:
 
         return node_id
 
+    def add_entities(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """
+        Add a batch of (entity_type, properties) pairs in a single pass.
+        Existing entities are merged in place; new ones are inserted with
+        one add_nodes_from call. Returns the Node IDs in input order.
+        """
+        nodes = self.graph.nodes
+        entity_index = self.entity_index
+        new_nodes: Dict[str, Dict[str, Any]] = {}
+        node_ids: List[str] = []
+
+        for entity_type, properties in items:
+            unique_key = self._get_unique_key(entity_type, properties)
+            node_id = entity_index.get(unique_key) if unique_key else None
+
+            if node_id is not None:
+                # Merge into an existing node, or one pending in this batch
+                attrs = new_nodes.get(node_id)
+                (attrs if attrs is not None else nodes[node_id]).update(properties)
+            else:
+                node_id = str(uuid.uuid4())
+                new_nodes[node_id] = {"type": entity_type, **properties}
+                if unique_key:
+                    entity_index[unique_key] = node_id
+
+            node_ids.append(node_id)
+
+        if new_nodes:
+            self.graph.add_nodes_from(new_nodes.items())
+        return node_ids
+
     def add_relationship(
         self,
         source_id: str,
@@ -58,10 +98,12 @@ class KnowledgeGraph:
         self, entity_type: str, properties: Dict[str, Any]
     ) -> Optional[str]:
         """Generate a unique key for deduplication."""
-        # Priority keys
-        for key in ["url", "id", "isbn", "sku", "email"]:
-            if key in properties and properties[key]:
-                return f"{entity_type}:{key}:{properties[key]}"
+        # Priority keys (specialized per entity type)
+        for key in _TYPE_KEY_PRIORITY.get(entity_type, _DEFAULT_KEY_PRIORITY):
+            value = properties.get(key)
+            if value:
+                # Interned so entity_index lookups hash/compare cheaply
+                return sys.intern(f"{entity_type}:{key}:{value}")
 
         # Fallback: Name + Type (weak identity)
         if "name" in properties:
@@ -80,19 +122,26 @@ class KnowledgeGraph:
 
     def export_graphml(self, path: str):
         """Export the graph to GraphML format."""
+        # NetworkX GraphML writer requires attributes to be scalar or simple types.
+        # Serialize complex dicts/lists to strings in place (instead of copying
+        # the whole graph) and restore the originals afterwards. Callers must
+        # not add entities meanwhile; DataExporter stops its writer first.
+        originals: Dict[str, Dict[str, Any]] = {}
         try:
-            # NetworkX GraphML writer requires attributes to be scalar or simple types.
-            # We need to serialize complex dicts/lists to strings.
-            G_export = self.graph.copy()
-            for node, data in G_export.nodes(data=True):
+            for node, data in self.graph.nodes(data=True):
                 for k, v in data.items():
                     if isinstance(v, (dict, list)):
+                        originals.setdefault(node, {})[k] = v
                         data[k] = json.dumps(v)
 
-            nx.write_graphml(G_export, path)
+            nx.write_graphml(self.graph, path)
             logger.info(f"Graph exported to {path}")
         except Exception as e:
             logger.error(f"Failed to export GraphML: {e}")
+        finally:
+            nodes = self.graph.nodes
+            for node, saved in originals.items():
+                nodes[node].update(saved)
 
     def to_json(self) -> Dict[str, Any]:
         """Return graph as JSON node-link data."""
@@ -0,0 +1,151 @@
+import hashlib
+import logging
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_MASK_64 = (1 << 64) - 1
+# Shingles hashed per step; bounds the (num_perm x chunk) working matrix
+_SHINGLE_CHUNK = 1024
+
+
+class NearDuplicateIndex:
+    """
+    In-memory MinHash-LSH index for spotting near-duplicate page content.
+
+    Pages are reduced to word shingles, hashed into a fixed-size MinHash
+    signature and bucketed by signature bands. Candidates that share a band
+    are confirmed by estimated Jaccard similarity against the threshold.
+    At most `max_entries` pages are kept; the oldest are evicted first.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        num_perm: int = 128,
+        bands: int = 16,
+        shingle_size: int = 5,
+        seed: int = 1,
+        max_entries: Optional[int] = None,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.max_entries = max_entries
+
+        # Multiply-shift hash family (odd multipliers), one per permutation
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+
+        # Insertion ordered, so the first key is the oldest
+        self._signatures: Dict[str, np.ndarray] = {}
+        self._digests: Dict[str, bytes] = {}
+        self._buckets: List[Dict[bytes, List[str]]] = [
+            defaultdict(list) for _ in range(bands)
+        ]
+
+    def signature(self, content: str) -> Optional[np.ndarray]:
+        """
+        MinHash signature of `content` (None if it is too short to shingle).
+        Touches no index state, so it can run in a worker thread.
+        """
+        tokens = content.split()
+        k = self.shingle_size
+        if len(tokens) < k:
+            return None
+
+        shingles = np.fromiter(
+            {
+                hash(" ".join(tokens[i : i + k])) & _MASK_64
+                for i in range(len(tokens) - k + 1)
+            },
+            dtype=np.uint64,
+        )
+        # (a * x + b) mod 2^64, keep the high 32 bits; running min over
+        # fixed-size chunks of shingles so large pages stay in bounded memory
+        a = self._a[:, None]
+        b = self._b[:, None]
+        signature = np.full(self.num_perm, np.iinfo(np.uint64).max, dtype=np.uint64)
+        with np.errstate(over="ignore"):
+            for start in range(0, len(shingles), _SHINGLE_CHUNK):
+                chunk = shingles[None, start : start + _SHINGLE_CHUNK]
+                hashed = a * chunk
+                hashed += b
+                hashed >>= np.uint64(32)
+                np.minimum(signature, hashed.min(axis=1), out=signature)
+        return signature
+
+    @staticmethod
+    def _digest(content: str) -> bytes:
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[i * self.rows : (i + 1) * self.rows].tobytes()
+            for i in range(self.bands)
+        ]
+
+    def _evict_oldest(self):
+        key = next(iter(self._signatures))
+        signature = self._signatures.pop(key)
+        self._digests.pop(key, None)
+        for bucket, band in zip(self._buckets, self._band_keys(signature)):
+            keys = bucket[band]
+            keys.remove(key)
+            if not keys:
+                del bucket[band]
+
+    def is_exact_duplicate(self, key: str, content: str) -> bool:
+        """Whether `content` is byte-for-byte the content indexed under `key`."""
+        return self._digests.get(key) == self._digest(content)
+
+    def clear(self):
+        """Forget every indexed page."""
+        self._signatures.clear()
+        self._digests.clear()
+        for bucket in self._buckets:
+            bucket.clear()
+
+    def check_and_add(
+        self, key: str, content: str, signature: Optional[np.ndarray] = None
+    ) -> Optional[str]:
+        """
+        Return the key of an indexed near-duplicate of `content`, or None.
+        Content without a near-duplicate is added to the index under `key`.
+        Pass a precomputed `signature` to skip hashing the content again.
+        """
+        if signature is None:
+            signature = self.signature(content)
+        if signature is None:
+            return None
+
+        bands = self._band_keys(signature)
+
+        candidates = set()
+        for bucket, band in zip(self._buckets, bands):
+            candidates.update(bucket.get(band, ()))
+        candidates.discard(key)
+
+        for candidate in candidates:
+            similarity = float(np.mean(self._signatures[candidate] == signature))
+            if similarity >= self.threshold:
+                return candidate
+
+        if key not in self._signatures:
+            if self.max_entries is not None:
+                while len(self._signatures) >= self.max_entries:
+                    self._evict_oldest()
+            self._signatures[key] = signature
+            self._digests[key] = self._digest(content)
+            for bucket, band in zip(self._buckets, bands):
+                bucket[band].append(key)
+        return None
@@ -1,43 +1,125 @@
 import asyncio
 import logging
-import random
+import re
+import time
+from collections import Counter, OrderedDict
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 from urllib.parse import urlparse
 
 import scram_hpc_rs
 
-from src.core.config import config
+from src.core.config import config, next_proxy, next_ua
 from src.fetching.rate_limiter import RateLimiter
+from src.fetching.dedup import NearDuplicateIndex
 from src.core.events import event_bus
 from src.data.cache import CacheManager
 
 logger = logging.getLogger(__name__)
 
+# Bot-detection markers; they appear early in challenge pages, so only the
+# head of the response is scanned
+_ESCALATE_RE = re.compile(r"challenge|cloudflare", re.IGNORECASE)
+_ESCALATE_SCAN_CHARS = 8192
+_ESCALATE_STATUSES = frozenset({403, 429, 503})
+# Past this size a 200 body with a marker is only treated as a challenge
+# when it is dominated by script code (interstitials are mostly script).
+# Density is estimated from a few fixed windows, not the whole body: JS is
+# dense in these characters, while text, markup and inline JSON are not.
+_ESCALATE_MAX_CHALLENGE_CHARS = 65536
+_ESCALATE_SAMPLE_WINDOWS = 4
+_ESCALATE_SAMPLE_CHARS = 2048
+_ESCALATE_CODE_CHARS = ";=()"
+_ESCALATE_MIN_CODE_RATIO = 0.08
+
+# Minimum seconds between coalesced stats_update publishes
+_STATS_FLUSH_INTERVAL = 0.25
+
+
+@lru_cache(maxsize=8192)
+def _split_url(url: str) -> tuple[str, str]:
+    # Retries, escalations and revisits parse the same URLs repeatedly
+    try:
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}{parsed.path}", parsed.netloc
+    except Exception:
+        return "INVALID_URL", ""
+
+
+def _is_script_heavy(content: str) -> bool:
+    """Estimate from evenly spaced windows whether `content` is mostly JS."""
+    span = len(content) - _ESCALATE_SAMPLE_CHARS
+    code_chars = 0
+    for i in range(1, _ESCALATE_SAMPLE_WINDOWS + 1):
+        start = span * i // (_ESCALATE_SAMPLE_WINDOWS + 1)
+        end = start + _ESCALATE_SAMPLE_CHARS
+        code_chars += sum(content.count(ch, start, end) for ch in _ESCALATE_CODE_CHARS)
+    sampled = _ESCALATE_SAMPLE_WINDOWS * _ESCALATE_SAMPLE_CHARS
+    return code_chars >= sampled * _ESCALATE_MIN_CODE_RATIO
+
 
 class FetchingEngine:
     def __init__(self):
         self.rate_limiter = RateLimiter()
         self.total_bandwidth_saved = 0
         self.cache = CacheManager()
+        # Pages whose content nearly matches a page fetched under another URL
+        self.near_duplicates = (
+            NearDuplicateIndex(
+                threshold=config.NEAR_DUPLICATE_THRESHOLD,
+                max_entries=config.NEAR_DUPLICATE_MAX_PAGES,
+            )
+            if config.NEAR_DUPLICATE_THRESHOLD > 0
+            else None
+        )
+        # Duplicate URL -> original URL for pages whose extraction can be
+        # skipped; bounded like the index, oldest entries dropped first
+        self.near_duplicate_urls: OrderedDict[str, str] = OrderedDict()
+        # Stat increments batched between publishes
+        self._stats_pending: Counter[str] = Counter()
+        self._bandwidth_dirty = False
+        self._stats_last_flush = 0.0
+        # Prebuilt request headers, one template per User-Agent
+        self._base_headers: Dict[str, Dict[str, str]] = {
+            ua: {
+                "User-Agent": ua,
+                "Accept-Encoding": "gzip, br",
+                "Accept": "application/json,text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            }
+            for ua in config.USER_AGENTS
+        }
+
+    def reset_duplicates(self):
+        """Forget pages seen so far, so a new session starts from scratch."""
+        if self.near_duplicates is not None:
+            self.near_duplicates.clear()
+        self.near_duplicate_urls.clear()
+
+    def _remember_duplicate(self, url: str, original: str):
+        duplicates = self.near_duplicate_urls
+        duplicates[url] = original
+        duplicates.move_to_end(url)
+        while len(duplicates) > config.NEAR_DUPLICATE_MAX_PAGES:
+            duplicates.popitem(last=False)
+
+    def _parse_url(self, url: str) -> tuple[str, str]:
+        """Parse once, returning (safe_url, netloc) for logging and rate limiting."""
+        return _split_url(url)
 
     def _sanitize_url(self, url: str) -> str:
         """Strip query parameters and fragments for safe logging."""
-        try:
-            parsed = urlparse(url)
-            return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-        except Exception:
-            return "INVALID_URL"
+        return self._parse_url(url)[0]
 
     async def fetch(self, url: str) -> tuple[str, int, bytes]:
         """
         Fetch a URL with rate limiting and automatic escalation.
         Returns: (content, status_code, screenshot_bytes)
         """
-        safe_url = self._sanitize_url(url)
+        safe_url, netloc = self._parse_url(url)
 
         # Rate Limiting
-        event_bus.publish("log", message=f"Rate Limiting: {urlparse(url).netloc}")
-        await self.rate_limiter.acquire(url)
+        event_bus.publish("log", message=f"Rate Limiting: {netloc}")
+        await self.rate_limiter.acquire(netloc)
 
         logger.info(f"Fetching: {safe_url}")
 
@@ -54,7 +136,22 @@ class FetchingEngine:
 
         if status == 200:
             logger.info(f"Successfully fetched {safe_url} ({len(content)} bytes)")
-            event_bus.publish("stats_update", metric="pages_scanned", increment=1)
+            self._stats_pending["pages_scanned"] += 1
+
+            if self.near_duplicates is not None:
+                # Hash off the event loop; only the index update runs on it
+                signature = await asyncio.to_thread(
+                    self.near_duplicates.signature, content
+                )
+                original = self.near_duplicates.check_and_add(url, content, signature)
+                if original is not None:
+                    logger.info(f"Near-duplicate content: {safe_url} ~ {original}")
+                    # Only exact copies yield the same data, unless opted in
+                    if (
+                        config.SKIP_NEAR_DUPLICATES
+                        or self.near_duplicates.is_exact_duplicate(original, content)
+                    ):
+                        self._remember_duplicate(url, original)
 
             # Calculate bandwidth saved
             if wire_length is not None:
@@ -62,11 +159,7 @@ class FetchingEngine:
                 # len(content) is the uncompressed size (approx)
                 saved_bytes = max(0, len(content) - wire_length)
                 self.total_bandwidth_saved += saved_bytes
-
-                saved_mb = self.total_bandwidth_saved / (1024 * 1024)
-                event_bus.publish(
-                    "stats_update", metric="bandwidth_saved", value=f"{saved_mb:.2f} MB"
-                )
+                self._bandwidth_dirty = True
             else:
                 # Fallback if wire_length is unknown (e.g. chunked encoding or browser fetch)
                 # We don't update the metric to avoid guessing
@@ -74,35 +167,51 @@ class FetchingEngine:
 
         else:
             logger.error(f"Failed to fetch {safe_url}. Status: {status}")
-            event_bus.publish("stats_update", metric="errors", increment=1)
+            self._stats_pending["errors"] += 1
+
+        if time.monotonic() - self._stats_last_flush >= _STATS_FLUSH_INTERVAL:
+            self.flush_stats()
 
         return content, status, screenshot
 
+    def flush_stats(self):
+        """Publish stat changes accumulated since the last flush."""
+        for metric, increment in self._stats_pending.items():
+            event_bus.publish("stats_update", metric=metric, increment=increment)
+        self._stats_pending.clear()
+
+        if self._bandwidth_dirty:
+            saved_mb = self.total_bandwidth_saved / (1024 * 1024)
+            event_bus.publish(
+                "stats_update", metric="bandwidth_saved", value=f"{saved_mb:.2f} MB"
+            )
+            self._bandwidth_dirty = False
+
+        self._stats_last_flush = time.monotonic()
+
     async def _fetch_http(self, url: str) -> tuple[str, int, Optional[int]]:
         """Tier 1: Fetch using Rust HPC (TLS spoofing) with Caching."""
         try:
-            headers = {
-                "User-Agent": random.choice(config.USER_AGENTS),
-                "Accept-Encoding": "gzip, br",
-                "Accept": "application/json,text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            }
+            # Shared template; only copied when conditional headers are added
+            headers = self._base_headers[next_ua()]
 
             # Check Cache
             cache_entry = self.cache.get_entry(url)
             if cache_entry:
+                headers = headers.copy()
                 if cache_entry.get("etag"):
                     headers["If-None-Match"] = cache_entry["etag"]
                 if cache_entry.get("last_modified"):
                     headers["If-Modified-Since"] = cache_entry["last_modified"]
 
-            # Call Rust function
+            # Call Rust function; it keeps one pooled client per proxy
             # Returns (content, status, wire_length, response_headers)
             (
                 content,
                 status,
                 wire_length,
                 response_headers,
-            ) = await scram_hpc_rs.fetch_url(url, headers)
+            ) = await scram_hpc_rs.fetch_url(url, headers, next_proxy())
 
             # Handle 304 Not Modified
             if status == 304 and cache_entry:
@@ -115,20 +224,25 @@ class FetchingEngine:
 
             # Handle 200 OK
             if status == 200:
-                # Check for content hash match (Deduplication)
-                new_hash = self.cache.get_content_hash(content)
-                if cache_entry and cache_entry.get("content_hash") == new_hash:
-                    logger.info(f"Content Unchanged (Hash Match) for {url}")
-                    # We could skip processing here, but the agent might need to see it again.
-                    # For now, we just update the timestamp in cache implicitly if we were to save it again.
-                    # But let's just return it.
+                # Header names arrive lowercased from the Rust layer
+                etag = response_headers.get("etag")
+                last_modified = response_headers.get("last-modified")
+
+                # ETag/Last-Modified already drive change detection; only
+                # fingerprint the body when the server gave us neither
+                new_hash = None
+                if not (etag or last_modified):
+                    new_hash = self.cache.get_content_hash(content)
+                    if cache_entry and cache_entry.get("content_hash") == new_hash:
+                        logger.info(f"Content Unchanged (Hash Match) for {url}")
+                        # We could skip processing here, but the agent might need to see it again.
+                        # For now, we just update the timestamp in cache implicitly if we were to save it again.
+                        # But let's just return it.
 
                 # Update Cache
-                etag = response_headers.get("etag") or response_headers.get("ETag")
-                last_modified = response_headers.get(
-                    "last-modified"
-                ) or response_headers.get("Last-Modified")
-                self.cache.update_entry(url, content, etag, last_modified)
+                self.cache.update_entry(
+                    url, content, etag, last_modified, content_hash=new_hash
+                )
 
             return content, status, wire_length
         except Exception as e:
@@ -139,8 +253,15 @@ class FetchingEngine:
         """Tier 2: Fetch using Rust Mirage Engine (CDP)."""
         try:
             # Call Rust function
+            # Browsers are pooled on the Rust side, hold at most
+            # BROWSER_MAX_PAGES open pages and are recycled after
+            # BROWSER_MAX_USES pages
             content, status, screenshot = await scram_hpc_rs.fetch_browser(
-                url, config.HEADLESS
+                url,
+                config.HEADLESS,
+                config.BROWSER_POOL_SIZE,
+                config.BROWSER_MAX_USES,
+                config.BROWSER_MAX_PAGES,
             )
             # Convert screenshot (list of ints) to bytes
             screenshot_bytes = bytes(screenshot) if screenshot else b""
@@ -151,9 +272,12 @@ class FetchingEngine:
 
     def _should_escalate(self, status: int, content: str) -> bool:
         """Determine if we should escalate to browser fetching."""
-        if status in [403, 429, 503]:
+        if status in _ESCALATE_STATUSES:
             return True
         # Simple check for Cloudflare/bot detection text
-        if "challenge" in content.lower() or "cloudflare" in content.lower():
-            return True
-        return False
+        if _ESCALATE_RE.search(content, 0, _ESCALATE_SCAN_CHARS) is None:
+            return False
+        if status == 200 and len(content) > _ESCALATE_MAX_CHALLENGE_CHARS:
+            # Large page that mentions a marker: escalate only if script-heavy
+            return _is_script_heavy(content)
+        return True
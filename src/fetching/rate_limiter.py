@@ -1,45 +1,95 @@
 import asyncio
 import time
-from collections import defaultdict
-from urllib.parse import urlparse
+from dataclasses import dataclass, field
+from typing import Dict
 from src.core.config import config
 
+# Seconds between sweeps of idle per-domain buckets
+_PRUNE_INTERVAL = 60.0
+
+
+@dataclass
+class TokenBucket:
+    """Token bucket refilled continuously at `rate` tokens per second."""
+
+    rate: float
+    capacity: float
+    tokens: float = field(init=False)
+    # Looked up per instance so a patched clock applies
+    last_refill: float = field(default_factory=lambda: time.monotonic())
+
+    def __post_init__(self):
+        self.tokens = self.capacity
+
+    def available_at(self, now: float) -> float:
+        """Earliest time at or after `now` when a token can be taken."""
+        # The refill clock may already be ahead of `now` (slots booked in
+        # the future); it never moves backwards
+        start = max(now, self.last_refill)
+        tokens = min(
+            self.capacity, self.tokens + (start - self.last_refill) * self.rate
+        )
+        return start if tokens >= 1.0 else start + (1.0 - tokens) / self.rate
+
+    def take(self, at: float):
+        """Spend one token at time `at` (no earlier than available_at)."""
+        at = max(at, self.last_refill)
+        self.tokens = min(
+            self.capacity, self.tokens + (at - self.last_refill) * self.rate
+        )
+        self.last_refill = at
+        self.tokens -= 1.0
+
+    def reserve(self, now: float) -> float:
+        """Book the next free slot and return how long the caller must wait."""
+        at = self.available_at(now)
+        self.take(at)
+        return at - now
+
+    def is_full(self, now: float) -> bool:
+        """True once idle long enough to refill; dropping it then is lossless."""
+        return self.tokens + (now - self.last_refill) * self.rate >= self.capacity
+
 
 class RateLimiter:
     def __init__(self):
         self.global_limit = config.GLOBAL_RATE_LIMIT
         self.domain_limit = config.DOMAIN_RATE_LIMIT
-        self.last_global_request = 0.0
-        self.last_domain_request = defaultdict(float)
-        self.lock = asyncio.Lock()
-
-    async def acquire(self, url: str):
-        domain = urlparse(url).netloc
-        sleep_time = 0.0
-
-        async with self.lock:
-            now = time.time()
-
-            # Global Rate Limit
-            time_since_global = now - self.last_global_request
-            if time_since_global < (1.0 / self.global_limit):
-                sleep_time = max(
-                    sleep_time, (1.0 / self.global_limit) - time_since_global
-                )
-
-            # Domain Rate Limit
-            time_since_domain = now - self.last_domain_request[domain]
-            if time_since_domain < (1.0 / self.domain_limit):
-                sleep_time = max(
-                    sleep_time, (1.0 / self.domain_limit) - time_since_domain
-                )
-
-            # Reserve the slot by updating times assuming we sleep
-            # This is a slight approximation but prevents race conditions
-            # effectively "booking" the time slot
-            self.last_global_request = now + sleep_time
-            self.last_domain_request[domain] = now + sleep_time
-
-        # Sleep outside the lock
+        self.burst = config.RATE_LIMIT_BURST
+        self.global_bucket = TokenBucket(self.global_limit, self.burst)
+        self.domain_buckets: Dict[str, TokenBucket] = {}
+        self._next_prune = time.monotonic() + _PRUNE_INTERVAL
+
+    async def acquire(self, domain: str):
+        """Wait for a request slot on `domain` (a URL netloc)."""
+        now = time.monotonic()
+
+        # State is sharded per domain and bucket updates never await, so
+        # they run atomically on the event loop without a lock; only the
+        # wait itself yields and callers on other domains are never blocked
+        bucket = self.domain_buckets.get(domain)
+        if bucket is None:
+            bucket = self.domain_buckets[domain] = TokenBucket(
+                self.domain_limit, self.burst, last_refill=now
+            )
+        # One gate time for both buckets (GCRA): a request held back by its
+        # domain spends its global token at the slot it actually uses
+        gate = max(self.global_bucket.available_at(now), bucket.available_at(now))
+        self.global_bucket.take(gate)
+        bucket.take(gate)
+        sleep_time = gate - now
+
+        if now >= self._next_prune:
+            self._prune(now)
+
         if sleep_time > 0:
             await asyncio.sleep(sleep_time)
+
+    def _prune(self, now: float):
+        """Drop buckets for domains idle long enough to have fully refilled."""
+        self.domain_buckets = {
+            domain: bucket
+            for domain, bucket in self.domain_buckets.items()
+            if not bucket.is_full(now)
+        }
+        self._next_prune = now + _PRUNE_INTERVAL
@@ -1,7 +1,12 @@
 from __future__ import annotations
 import logging
-from typing import cast
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, cast
 
+from rich.errors import MarkupError
+from rich.text import Text
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import (
@@ -20,6 +25,7 @@ from textual.widgets import (
 from textual.screen import Screen, ModalScreen
 from textual.reactive import reactive
 from textual.binding import Binding
+from textual.css.query import NoMatches
 
 # Use absolute imports relative to project root
 from src.core.events import event_bus, Event
@@ -27,6 +33,17 @@ from src.agent.state import AgentState
 from src.agent.graph import app as agent_graph
 from src.agent.nodes import fetching_engine, gemini_client
 
+# Worker statuses not echoed to the activity feed as plain progress lines
+_UNINTERESTING_WORKER_STATUSES = frozenset({"Idle", "Error"})
+_REVIEW_NEW_LABEL = "Review Latest Data (New)"
+_CUSTOM_OBJECTIVE = "Custom Objective..."
+
+
+@lru_cache(maxsize=8)
+def _format_model(name: str) -> str:
+    # e.g. "gemini-3-pro-preview" -> "Google Gemini 3 Pro Preview"
+    return f"Google {name.replace('-', ' ').title()}"
+
 
 class ReviewModal(ModalScreen):
     """Modal to review a data item with its screenshot."""
@@ -55,14 +72,14 @@ class ReviewModal(ModalScreen):
         table = self.query_one(DataTable)
         table.add_columns("Field", "Value")
 
-        for k, v in self.item.items():
-            if k != "_metadata":
-                table.add_row(str(k), str(v))
-
+        rows = [(str(k), str(v)) for k, v in self.item.items() if k != "_metadata"]
         # Add metadata rows
-        if "_metadata" in self.item:
-            for k, v in self.item["_metadata"].items():
-                table.add_row(f"[dim]{k}[/]", f"[dim]{v}[/]")
+        rows.extend(
+            (f"[dim]{k}[/]", f"[dim]{v}[/]")
+            for k, v in self.item.get("_metadata", {}).items()
+        )
+        # One call so the table lays out once
+        table.add_rows(rows)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "close-btn":
@@ -73,20 +90,28 @@ class DashboardScreen(Screen):
     """Main dashboard screen."""
 
     latest_item = reactive(None)
-    stats = reactive(
-        {
-            "pages_scanned": 0,
-            "items_extracted": 0,
-            "queue_size": 0,
-            "errors": 0,
-            "bandwidth_saved": "0 MB",
-        }
+    # One reactive per metric: watchers fire only when a value changes,
+    # so only that metric's label re-renders
+    STAT_METRICS = (
+        "pages_scanned",
+        "items_extracted",
+        "queue_size",
+        "errors",
+        "bandwidth_saved",
     )
+    pages_scanned = reactive(0, init=False)
+    items_extracted = reactive(0, init=False)
+    queue_size = reactive(0, init=False)
+    errors = reactive(0, init=False)
+    bandwidth_saved = reactive("0 MB", init=False)
 
     BINDINGS = [
         Binding("r", "show_review", "Review Data"),
     ]
 
+    # Seconds the activity pulse keeps animating after the last agent activity
+    PULSE_IDLE_TIMEOUT = 2.0
+
     def __init__(self, session_title: str, objective: str, seed_url: str, **kwargs):
         super().__init__(**kwargs)
         self.session_title = session_title
@@ -130,8 +155,13 @@ class DashboardScreen(Screen):
             # Activity Feed (Replaces Worker Pool)
             with Container(classes="activity-container"):
                 yield Label("Live Activity", classes="section-title")
+                # Bounded so long crawls keep constant memory and repaint cost
                 yield RichLog(
-                    id="activity-feed", wrap=True, highlight=True, markup=True
+                    id="activity-feed",
+                    wrap=True,
+                    highlight=True,
+                    markup=True,
+                    max_lines=2000,
                 )
 
             # Review Button
@@ -141,20 +171,77 @@ class DashboardScreen(Screen):
             with Container(classes="logs-container"):
                 yield Label("System Logs", classes="section-title")
                 # Changed from Log to RichLog for better wrapping
-                yield RichLog(id="log-output", wrap=True, highlight=True, markup=True)
+                yield RichLog(
+                    id="log-output",
+                    wrap=True,
+                    highlight=True,
+                    markup=True,
+                    max_lines=5000,
+                )
 
         yield Footer()
 
     def on_mount(self) -> None:
         """Called when the screen is mounted. Starts the agent."""
-        self.query_one("#log-output", RichLog).write(
-            "Dashboard ready. Starting agent..."
-        )
+        # Cache widget references so event handling never walks the DOM
+        self.activity_feed = self.query_one("#activity-feed", RichLog)
+        self.log_output = self.query_one("#log-output", RichLog)
+        self.main_status = self.query_one("#main-status", Label)
+        self.activity_pulse = self.query_one("#activity-pulse", ProgressBar)
+        self.review_btn = self.query_one("#review-btn", Button)
+        self.stat_labels = {
+            metric: self.query_one(f"#stat-{metric}", Label)
+            for metric in self.STAT_METRICS
+        }
+
+        # Last text written to each label, to skip no-op updates
+        self.rendered_text: Dict[str, str] = {}
+
+        # Pulse animation runs on its own 10 Hz timer, independent of event rate
+        self.last_activity = 0.0
+        self.pulse_timer = self.set_interval(0.1, self._pulse_bar, pause=True)
+
+        self.log_output.write("Dashboard ready. Starting agent...")
         # Start the agent now that the UI is ready to receive events
-        if hasattr(self.app, "start_agent"):
-            cast(ScramApp, self.app).start_agent(
-                self.session_title, self.objective, self.seed_url
-            )
+        app = cast(ScramApp, self.app)
+        app.attach_dashboard(self)
+        app.start_agent(self.session_title, self.objective, self.seed_url)
+
+    def on_unmount(self) -> None:
+        cast(ScramApp, self.app).detach_dashboard(self)
+
+    def set_label(self, key: str, label: Label, text: str) -> None:
+        """Update a label only when its text actually changes."""
+        if self.rendered_text.get(key) != text:
+            self.rendered_text[key] = text
+            label.update(text)
+
+    def note_activity(self) -> None:
+        """Keep the pulse animating while the agent reports activity."""
+        self.last_activity = time.monotonic()
+        self.pulse_timer.resume()
+
+    def _pulse_bar(self) -> None:
+        if time.monotonic() - self.last_activity > self.PULSE_IDLE_TIMEOUT:
+            self.pulse_timer.pause()
+            return
+        bar = self.activity_pulse
+        bar.progress = 0 if bar.progress >= bar.total else bar.progress + 5
+
+    def watch_pages_scanned(self, value: int) -> None:
+        self.stat_labels["pages_scanned"].update(str(value))
+
+    def watch_items_extracted(self, value: int) -> None:
+        self.stat_labels["items_extracted"].update(str(value))
+
+    def watch_queue_size(self, value: int) -> None:
+        self.stat_labels["queue_size"].update(str(value))
+
+    def watch_errors(self, value: int) -> None:
+        self.stat_labels["errors"].update(str(value))
+
+    def watch_bandwidth_saved(self, value: str) -> None:
+        self.stat_labels["bandwidth_saved"].update(value)
 
     def action_show_review(self):
         """Show review modal for the last extracted item."""
@@ -178,20 +265,21 @@ class SetupScreen(Screen):
     url_value = reactive("")
     current_model = reactive("Google Gemini 3 Pro Preview")
 
-    LOGO = """
+    # Plain Text renderables built once at import; no markup to re-parse
+    LOGO = Text("""
 ███████╗ ██████╗██████╗  █████╗ ███╗   ███╗
 ██╔════╝██╔════╝██╔══██╗██╔══██╗████╗ ████║
 ███████╗██║     ██████╔╝███████║██╔████╔██║
 ╚════██║██║     ██╔══██╗██╔══██║██║╚██╔╝██║
 ███████║╚██████╗██║  ██║██║  ██║██║ ╚═╝ ██║
 ╚══════╝ ╚═════╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝     ╚═╝
-    """
+    """)
 
-    HELP_TEXT = """
+    HELP_TEXT = Text("""
     /help show help
     /model switch model
     /exit exit the app
-    """
+    """)
 
     def compose(self) -> ComposeResult:
         with Container(id="setup-container"):
@@ -221,15 +309,24 @@ class SetupScreen(Screen):
 
         # Update model name from config if available, or keep default
         if config.DEFAULT_MODEL:
-            # Format it nicely e.g. "gemini-3-pro-preview" -> "Google Gemini 3 Pro Preview"
-            formatted = f"Google {config.DEFAULT_MODEL.replace('-', ' ').title()}"
-            self.current_model = formatted
-        self.query_one("#setup-input").focus()
+            self.current_model = _format_model(config.DEFAULT_MODEL)
+
+        # Cache the wizard widgets touched on every step
+        self.input_widget = self.query_one("#setup-input", Input)
+        self.prompt_symbol = self.query_one(".prompt-symbol", Label)
+        self.loading_indicator = self.query_one("#loading-indicator", LoadingIndicator)
+        self.history_area = self.query_one("#history-area", Container)
+        self.objective_options = self.query_one("#objective-options", OptionList)
+        self.suggestions_area = self.query_one("#suggestions-area", Container)
+        self.objective_choices: List[str] = []
+
+        self.input_widget.focus()
 
     def watch_current_model(self, value: str) -> None:
         try:
             self.query_one("#model-label", Label).update(value)
-        except Exception:
+        except NoMatches:
+            # Not composed yet; compose renders the current value
             pass
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
@@ -244,14 +341,13 @@ class SetupScreen(Screen):
 
         # Handle theme command
         if value.lower() == "/theme":
-            if hasattr(self.app, "toggle_theme"):
-                cast(ScramApp, self.app).toggle_theme()
-                self.query_one("#setup-input", Input).value = ""
-                self.notify("Theme switched!")
+            cast(ScramApp, self.app).toggle_theme()
+            self.input_widget.value = ""
+            self.notify("Theme switched!")
             return
 
-        input_widget = self.query_one("#setup-input", Input)
-        history_area = self.query_one("#history-area", Container)
+        input_widget = self.input_widget
+        history_area = self.history_area
 
         if self.step == 0:
             # User entered URL
@@ -266,8 +362,8 @@ class SetupScreen(Screen):
 
             # Toggle visibility
             input_widget.add_class("hidden")
-            self.query_one(".prompt-symbol").add_class("hidden")
-            self.query_one("#loading-indicator").remove_class("hidden")
+            self.prompt_symbol.add_class("hidden")
+            self.loading_indicator.remove_class("hidden")
 
             # Start analysis worker
             self.run_worker(self.analyze_url(value))
@@ -289,16 +385,7 @@ class SetupScreen(Screen):
             if status != 200:
                 self.notify(f"Failed to fetch URL: {status}", severity="error")
                 # Fallback to manual entry
-                self.step = 2
-
-                # Restore UI
-                self.query_one("#loading-indicator").add_class("hidden")
-                self.query_one(".prompt-symbol").remove_class("hidden")
-                input_widget = self.query_one("#setup-input", Input)
-                input_widget.remove_class("hidden")
-                input_widget.disabled = False
-                input_widget.placeholder = "Enter Objective..."
-                input_widget.focus()
+                self._reset_to_manual_objective()
                 return
 
             # Analyze with AI
@@ -308,24 +395,25 @@ class SetupScreen(Screen):
             summary = analysis.get("summary", "No summary available.")
             suggestions = analysis.get("suggestions", [])
 
-            self.query_one("#history-area", Container).mount(
+            self.history_area.mount(
                 Label(f"Summary: [italic]{summary}[/]", classes="history-item")
             )
 
             # Restore UI (hide loading)
-            self.query_one("#loading-indicator").add_class("hidden")
-            self.query_one(".prompt-symbol").remove_class("hidden")
+            self.loading_indicator.add_class("hidden")
+            self.prompt_symbol.remove_class("hidden")
             # Keep input hidden or disabled? We move to selection step.
             # Actually, we want to show options now.
 
-            options = self.query_one("#objective-options", OptionList)
+            options = self.objective_options
             options.clear_options()
-            for suggestion in suggestions:
-                options.add_option(suggestion)
-            options.add_option("Custom Objective...")
+            # Kept alongside the list so selection is a plain index lookup
+            self.objective_choices = [*suggestions, _CUSTOM_OBJECTIVE]
+            # One batch so the list lays out once
+            options.add_options(self.objective_choices)
 
             # Show suggestions
-            self.query_one("#suggestions-area").add_class("visible")
+            self.suggestions_area.add_class("visible")
             options.focus()
 
             self.step = 1  # Selection step
@@ -333,34 +421,36 @@ class SetupScreen(Screen):
         except Exception as e:
             self.notify(f"Analysis failed: {e}", severity="error")
             # Fallback
-            self.step = 2
+            self._reset_to_manual_objective()
 
-            # Restore UI
-            self.query_one("#loading-indicator").add_class("hidden")
-            self.query_one(".prompt-symbol").remove_class("hidden")
-            input_widget = self.query_one("#setup-input", Input)
-            input_widget.remove_class("hidden")
-            input_widget.disabled = False
-            input_widget.placeholder = "Enter Objective..."
-            input_widget.focus()
+    def _reset_to_manual_objective(self) -> None:
+        """Restore the input bar so the user can type an objective."""
+        self.step = 2
+
+        # Restore UI
+        self.loading_indicator.add_class("hidden")
+        self.prompt_symbol.remove_class("hidden")
+        input_widget = self.input_widget
+        input_widget.remove_class("hidden")
+        input_widget.disabled = False
+        input_widget.placeholder = "Enter Objective..."
+        input_widget.focus()
 
     def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         """Handle selection from the suggestions list."""
-        selected_index = event.option_index
-        options = self.query_one("#objective-options", OptionList)
-        selected_text = str(options.get_option_at_index(selected_index).prompt)
+        selected_text = str(self.objective_choices[event.option_index])
 
-        if selected_text == "Custom Objective...":
+        if selected_text == _CUSTOM_OBJECTIVE:
             # Switch to custom input
-            self.query_one("#suggestions-area").remove_class("visible")
-            input_widget = self.query_one("#setup-input", Input)
+            self.suggestions_area.remove_class("visible")
+            input_widget = self.input_widget
             input_widget.disabled = False
             input_widget.placeholder = "Enter Custom Objective..."
             input_widget.focus()
             self.step = 2
         else:
             self.objective_value = selected_text
-            self.query_one("#history-area", Container).mount(
+            self.history_area.mount(
                 Label(
                     f"Objective: [bold green]{selected_text}[/]", classes="history-item"
                 )
@@ -390,10 +480,30 @@ class ScramApp(App):
     THEMES = ["theme-default", "theme-matrix", "theme-cyberpunk"]
     current_theme_index = 0
 
+    # Seconds between UI flushes of buffered events
+    EVENT_FLUSH_INTERVAL = 0.05
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Events buffered between flushes; oldest are dropped under bursts
+        self._pending: deque[Event] = deque(maxlen=1024)
+        # Stats are folded as they arrive, so overflow never loses counts:
+        # last value wins, increments after it add up
+        self._pending_values: Dict[str, Any] = {}
+        self._pending_increments: Dict[str, int] = {}
+        # Dashboard receiving events; the bus is only subscribed while set
+        self._dashboard: Optional[DashboardScreen] = None
+        # Event type -> UI handler; unknown types are ignored
+        self._ui_handlers = {
+            "worker_status": self._on_worker_status,
+            "agent_activity": self._on_agent_activity,
+            "data_extracted": self._on_data_extracted,
+            "log": self._on_log,
+        }
+
     def on_mount(self) -> None:
         self.push_screen("setup")
-        # Subscribe to events
-        event_bus.subscribe(self.handle_event)
+        self.set_interval(self.EVENT_FLUSH_INTERVAL, self._drain_events)
 
     def toggle_theme(self) -> None:
         """Cycle through available themes."""
@@ -449,94 +559,194 @@ class ScramApp(App):
             # We can ignore the type error or cast it.
             await agent_graph.ainvoke(state, config={"recursion_limit": 500})  # type: ignore
         except Exception as e:
-            self.call_later(self.log_error, str(e))
+            # Goes through the batched log flush like any other log line
+            event_bus.publish("log", message=f"[red]ERROR: {e}[/]")
 
-    def log_error(self, message: str):
-        if self.screen.id == "dashboard":
-            self.screen.query_one("#log-output", RichLog).write(
-                f"[red]ERROR: {message}[/]"
-            )
+    def attach_dashboard(self, dashboard: DashboardScreen) -> None:
+        """Subscribe to the event bus and route its updates to `dashboard`."""
+        self._dashboard = dashboard
+        event_bus.subscribe(self.handle_event)
+
+    def detach_dashboard(self, dashboard: DashboardScreen) -> None:
+        """Stop event handling once `dashboard` is gone."""
+        if self._dashboard is dashboard:
+            event_bus.unsubscribe(self.handle_event)
+            self._dashboard = None
+            self._pending.clear()
+            self._pending_values.clear()
+            self._pending_increments.clear()
 
     def handle_event(self, event: Event):
         """Handle events from the event bus."""
-        # Schedule UI updates on the main thread
-        self.call_later(self._update_ui, event)
-
-    def _update_ui(self, event: Event):
-        """Update UI elements based on event type."""
-        # Only update if we are on the dashboard
-        if not self.screen or self.screen.id != "dashboard":
+        # Buffer only; the UI applies events in batches on its own timer.
+        # deque.append is atomic, so log records from other threads are safe;
+        # stats are only published from the event loop thread.
+        if event.type == "stats_update":
+            metric = event.payload["metric"]
+            if "value" in event.payload:
+                self._pending_values[metric] = event.payload["value"]
+                self._pending_increments.pop(metric, None)
+            elif "increment" in event.payload:
+                self._pending_increments[metric] = (
+                    self._pending_increments.get(metric, 0) + event.payload["increment"]
+                )
             return
+        self._pending.append(event)
 
-        try:
-            dashboard = cast(DashboardScreen, self.screen)
-
-            if event.type == "worker_status":
-                # Convert worker status to activity feed entry
-                status = event.payload["status"]
-                worker_id = event.payload["worker_id"]
+    def _drain_events(self) -> None:
+        """Apply all events buffered since the last tick in one pass."""
+        if not (self._pending or self._pending_values or self._pending_increments):
+            return
 
-                # Only log interesting statuses to avoid spam
-                if status not in ["Idle", "Error"]:
-                    activity_feed = dashboard.query_one("#activity-feed", RichLog)
-                    activity_feed.write(f"[dim]Worker {worker_id:02d}:[/] {status}")
+        events = []
+        while self._pending:
+            events.append(self._pending.popleft())
+        events = self._coalesce_worker_status(events)
+        values, self._pending_values = self._pending_values, {}
+        increments, self._pending_increments = self._pending_increments, {}
 
-                if status == "Error":
-                    activity_feed = dashboard.query_one("#activity-feed", RichLog)
-                    activity_feed.write(
-                        f"[red bold]Worker {worker_id:02d}: Error occurred[/]"
-                    )
+        dashboard = self._dashboard
+        if dashboard is None:
+            return
 
-            elif event.type == "agent_activity":
-                status = event.payload["status"]
-                dashboard.query_one("#main-status", Label).update(status)
-
-                # Pulse the progress bar
-                bar = dashboard.query_one("#activity-pulse", ProgressBar)
-                if bar.percentage is not None and bar.percentage < 100:
-                    bar.advance(5)
-                else:
-                    bar.progress = 0
-
-            elif event.type == "stats_update":
-                metric = event.payload["metric"]
-                if "value" in event.payload:
-                    dashboard.stats[metric] = event.payload["value"]
-                elif "increment" in event.payload:
-                    # Ensure it's an int before adding
-                    current = dashboard.stats.get(metric, 0)
-                    if isinstance(current, int):
-                        dashboard.stats[metric] = current + event.payload["increment"]
-
-                # Update Label
-                try:
-                    dashboard.query_one(f"#stat-{metric}", Label).update(
-                        str(dashboard.stats[metric])
-                    )
-                except Exception:
-                    pass
-
-            elif event.type == "data_extracted":
-                # Store latest item for review
-                if isinstance(dashboard, DashboardScreen):
-                    dashboard.latest_item = event.payload["item"]
-                    dashboard.query_one(
-                        "#review-btn", Button
-                    ).label = "Review Latest Data (New)"
-
-                    # Log to activity feed
-                    activity_feed = dashboard.query_one("#activity-feed", RichLog)
-                    activity_feed.write(f"[green]✅ Data Extracted[/]")
-
-            elif event.type == "log":
-                message = event.payload["message"]
-                # Use RichLog.write instead of Log.write_line
-                dashboard.query_one("#log-output", RichLog).write(message)
+        # Feed/log lines are gathered and written once per widget per tick
+        activity: List[str] = []
+        logs: List[str] = []
+
+        # Hold screen updates until the whole tick is applied: one repaint
+        with self.batch_update():
+            for event in events:
+                self._update_ui(dashboard, event, activity, logs)
+
+            if values or increments:
+                self._apply_stats(dashboard, values, increments)
+            self._write_lines(dashboard.activity_feed, activity)
+            self._write_lines(dashboard.log_output, logs)
+
+    @staticmethod
+    def _coalesce_worker_status(events: List[Event]) -> List[Event]:
+        """Keep only each worker's latest status per tick (errors always kept)."""
+        seen = set()
+        kept: List[Event] = []
+        for event in reversed(events):
+            if event.type == "worker_status" and event.payload["status"] != "Error":
+                worker_id = event.payload["worker_id"]
+                if worker_id in seen:
+                    continue
+                seen.add(worker_id)
+            kept.append(event)
+        kept.reverse()
+        return kept
+
+    @staticmethod
+    def _markup_line(line: str) -> Text:
+        # Parsed on its own so an unclosed tag cannot style later lines;
+        # malformed markup is shown as plain text
+        try:
+            return Text.from_markup(line)
+        except MarkupError:
+            return Text(line)
+
+    @classmethod
+    def _write_lines(cls, log: RichLog, lines: List[str]) -> None:
+        """Write a tick's lines in one call, isolating markup per line."""
+        if not lines:
+            return
+        text = Text("\n").join(cls._markup_line(line) for line in lines)
+        if log.highlight:
+            text = log.highlighter(text)
+        try:
+            log.write(text)
+        except Exception as e:
+            logging.getLogger(__name__).error(f"UI Update failed: {e}")
 
+    def _apply_stats(
+        self,
+        dashboard: DashboardScreen,
+        values: Dict[str, Any],
+        increments: Dict[str, int],
+    ) -> None:
+        """Set each changed metric once; its watcher redraws the label."""
+        for metric in values.keys() | increments.keys():
+            if metric not in dashboard.STAT_METRICS:
+                continue
+            value = values[metric] if metric in values else getattr(dashboard, metric)
+            # Ensure it's an int before adding
+            if metric in increments and isinstance(value, int):
+                value += increments[metric]
+            setattr(dashboard, metric, value)
+
+    def _update_ui(
+        self,
+        dashboard: DashboardScreen,
+        event: Event,
+        activity: List[str],
+        logs: List[str],
+    ):
+        """Update UI elements based on event type; feed/log lines are queued."""
+        handler = self._ui_handlers.get(event.type)
+        if handler is None:
+            return
+        try:
+            handler(dashboard, event.payload, activity, logs)
         except Exception as e:
             # Log error to file so we can see it
             logging.getLogger(__name__).error(f"UI Update failed: {e}")
 
+    def _on_worker_status(
+        self,
+        dashboard: DashboardScreen,
+        payload: Dict[str, Any],
+        activity: List[str],
+        logs: List[str],
+    ) -> None:
+        # Convert worker status to activity feed entry
+        status = payload["status"]
+        worker_id = payload["worker_id"]
+
+        # Only log interesting statuses to avoid spam
+        if status not in _UNINTERESTING_WORKER_STATUSES:
+            activity.append(f"[dim]Worker {worker_id:02d}:[/] {status}")
+
+        if status == "Error":
+            activity.append(f"[red bold]Worker {worker_id:02d}: Error occurred[/]")
+
+    def _on_agent_activity(
+        self,
+        dashboard: DashboardScreen,
+        payload: Dict[str, Any],
+        activity: List[str],
+        logs: List[str],
+    ) -> None:
+        dashboard.set_label("main-status", dashboard.main_status, payload["status"])
+        dashboard.note_activity()
+
+    def _on_data_extracted(
+        self,
+        dashboard: DashboardScreen,
+        payload: Dict[str, Any],
+        activity: List[str],
+        logs: List[str],
+    ) -> None:
+        # Store latest item for review
+        dashboard.latest_item = payload["item"]
+        # Reassigning the same label would still repaint the button
+        if dashboard.rendered_text.get("review-btn") != _REVIEW_NEW_LABEL:
+            dashboard.rendered_text["review-btn"] = _REVIEW_NEW_LABEL
+            dashboard.review_btn.label = _REVIEW_NEW_LABEL
+
+        # Log to activity feed
+        activity.append("[green]✅ Data Extracted[/]")
+
+    def _on_log(
+        self,
+        dashboard: DashboardScreen,
+        payload: Dict[str, Any],
+        activity: List[str],
+        logs: List[str],
+    ) -> None:
+        logs.append(payload["message"])
+
 
 if __name__ == "__main__":
     app = ScramApp()
@@ -0,0 +1,47 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.agent.state import AgentState
+from src.data.cache import CacheManager
+from src.fetching.engine import FetchingEngine
+
+
+@pytest.fixture
+def fetching_engine():
+    """FetchingEngine with an in-memory cache and rate limiting stubbed out."""
+    # Avoid opening (and leaving behind) the on-disk scram_data/cache.db
+    with patch("src.fetching.engine.CacheManager", lambda: CacheManager(":memory:")):
+        engine = FetchingEngine()
+    engine.rate_limiter.acquire = AsyncMock()
+    yield engine
+    engine.cache.close()
+
+
+@pytest.fixture
+def make_state():
+    """Build an AgentState with empty defaults; keyword arguments override."""
+
+    def _make_state(**overrides) -> AgentState:
+        state = AgentState(
+            session_title="Test",
+            objective="Test",
+            data_schema={},
+            url_queue=[],
+            visited_urls=set(),
+            failed_urls=set(),
+            extracted_data=[],
+            current_urls=[],
+            current_contents=[],
+            current_screenshots=[],
+            relevant_flags=[],
+            batch_next_urls=[],
+            template_groups={},
+            optimized_templates=set(),
+            compressed_history="",
+            recent_activity=[],
+        )
+        state.update(overrides)  # type: ignore[typeddict-item]
+        return state
+
+    return _make_state
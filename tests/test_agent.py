@@ -10,31 +10,46 @@ async def test_agent_workflow():
     with (
         patch("src.agent.nodes.gemini_client") as mock_gemini,
         patch("src.agent.nodes.fetching_engine") as mock_fetcher,
+        patch("src.agent.nodes.collector") as mock_collector,
+        patch("src.agent.nodes.exporter") as mock_exporter,
     ):
         # Setup Mocks using AsyncMock for async methods
         mock_gemini.generate_schema = AsyncMock(
             return_value={"type": "object", "properties": {"name": {"type": "string"}}}
         )
 
-        # analyze_relevance needs to be an AsyncMock with side_effect
-        mock_gemini.analyze_relevance = AsyncMock(
-            side_effect=[
-                {
-                    "is_relevant": True,
-                    "reason": "Test",
-                    "next_urls": ["http://test.com/2"],
-                },  # First URL
-                {
-                    "is_relevant": False,
-                    "reason": "Not relevant",
-                    "next_urls": [],
-                },  # Second URL
+        # Relevance is scored per batch: one result per page, in page order
+        relevance = {
+            "http://test.com/1": {
+                "relevance_score": 90,
+                "reason": "Test",
+                "next_urls": ["http://test.com/2"],
+            },
+            "http://test.com/2": {
+                "relevance_score": 10,
+                "reason": "Not relevant",
+                "next_urls": [],
+            },
+        }
+        mock_gemini.analyze_relevance_batch = AsyncMock(
+            side_effect=lambda objective, pages: [
+                dict(relevance[url]) for url, _ in pages
             ]
         )
 
         mock_gemini.analyze_api_endpoints = AsyncMock(return_value=[])
 
-        mock_gemini.extract_data = AsyncMock(return_value=[{"name": "Test Item"}])
+        mock_gemini.fast_extract = AsyncMock(
+            side_effect=lambda content, objective: [{"name": "Test Item"}]
+        )
+
+        # Extracted items go to the raw collector rather than into state
+        saved: list = []
+        mock_collector.save = AsyncMock(side_effect=saved.extend)
+        mock_collector.load_all = AsyncMock(side_effect=lambda: list(saved))
+        mock_gemini.refine_data = AsyncMock(side_effect=lambda batch, schema: batch)
+        mock_exporter.save_batch = AsyncMock()
+        mock_exporter.finalize_session = AsyncMock()
 
         # Mock fetch method
         mock_fetcher.fetch = AsyncMock(return_value=("<html>Content</html>", 200, b""))
@@ -61,7 +76,9 @@ async def test_agent_workflow():
 
         result = await app.ainvoke(initial_state)
 
-        assert len(result["extracted_data"]) >= 1
-        assert result["extracted_data"][0]["name"] == "Test Item"
+        assert len(saved) >= 1
+        assert saved[0]["name"] == "Test Item"
+        assert saved[0]["_metadata"]["source_url"] == "http://test.com/1"
+        mock_exporter.finalize_session.assert_awaited_once_with("Test Session")
         assert "http://test.com/1" in result["visited_urls"]
         assert "http://test.com/2" in result["visited_urls"]
@@ -1,9 +1,6 @@
 import json
-import shutil
 import sqlite3
-import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
@@ -13,11 +10,11 @@ from src.data.export import DataExporter
 
 class TestDataExporter:
     @pytest.fixture
-    def exporter(self):
-        self.temp_dir = tempfile.mkdtemp()
-        exporter = DataExporter(base_dir=self.temp_dir)
+    def exporter(self, tmp_path):
+        self.temp_dir = tmp_path
+        exporter = DataExporter(base_dir=str(tmp_path))
         yield exporter
-        shutil.rmtree(self.temp_dir)
+        exporter.close()
 
     def test_save_config(self, exporter):
         session_title = "Test Session"
@@ -37,6 +34,7 @@ class TestDataExporter:
         session_title = "Test Session"
         data = [{"id": 1, "val": "a"}, {"id": 2, "val": "b"}]
         await exporter.save_batch(session_title, data)
+        exporter.flush()
 
         session_dir = Path(self.temp_dir) / "Test_Session"
         data_dir = session_dir / "data"
@@ -44,24 +42,22 @@ class TestDataExporter:
         assert (data_dir / "raw_data.csv").exists()
 
         # Check JSONL content
-        with open(data_dir / "raw_data.jsonl") as f:
-            lines = f.readlines()
+        lines = (data_dir / "raw_data.jsonl").read_text().splitlines()
         assert len(lines) == 2
         assert json.loads(lines[0])["id"] == 1
 
     @pytest.mark.asyncio
     async def test_finalize_session(self, exporter):
         session_title = "Test Session"
-        # Save duplicates to test deduplication
-        data1 = [{"url": "http://a.com", "val": "a"}]
-        data2 = [{"url": "http://a.com", "val": "a"}]  # Duplicate
-        data3 = [{"url": "http://b.com", "val": "b"}]
-
-        await exporter.save_batch(session_title, data1)
-        await exporter.save_batch(session_title, data2)
-        await exporter.save_batch(session_title, data3)
+        # Save duplicates to test deduplication (done at finalize, not save)
+        data = [
+            {"url": "http://a.com", "val": "a"},
+            {"url": "http://a.com", "val": "a"},  # Duplicate
+            {"url": "http://b.com", "val": "b"},
+        ]
+        await exporter.save_batch(session_title, data)
 
-        exporter.finalize_session(session_title)
+        await exporter.finalize_session(session_title)
 
         session_dir = Path(self.temp_dir) / "Test_Session"
         clean_dir = session_dir / "data"
@@ -69,10 +65,9 @@ class TestDataExporter:
         # Check Clean JSONL
         clean_jsonl = clean_dir / "clean_data.jsonl"
         assert clean_jsonl.exists()
-        df = pd.read_json(clean_jsonl, lines=True)
-        assert len(df) == 2  # Should be 2 unique items
-        assert "http://a.com" in df["url"].values
-        assert "http://b.com" in df["url"].values
+        rows = [json.loads(line) for line in clean_jsonl.read_text().splitlines()]
+        assert len(rows) == 2  # Should be 2 unique items
+        assert {row["url"] for row in rows} == {"http://a.com", "http://b.com"}
 
         # Check SQLite
         db_path = clean_dir / "database.sqlite"
@@ -81,3 +76,36 @@ class TestDataExporter:
         df_sql = pd.read_sql("SELECT * FROM extracted_data", conn)
         conn.close()
         assert len(df_sql) == 2
+
+        # The writer is stopped before the exports read the knowledge graph
+        assert exporter._writer_thread is None
+        assert (clean_dir / "knowledge_graph.graphml").exists()
+        assert exporter.graph.graph.number_of_nodes() == 2
+
+    def test_session_paths_cached(self, exporter):
+        paths = exporter._get_session_paths("My Session: v2!")
+
+        assert paths.session_dir == Path(self.temp_dir) / "My_Session__v2_"
+        assert paths.data_dir.is_dir()
+        assert paths.images_dir.is_dir()
+        assert paths.raw_jsonl == paths.data_dir / "raw_data.jsonl"
+        # Second lookup reuses the memoized layout
+        assert exporter._get_session_paths("My Session: v2!") is paths
+
+    @pytest.mark.asyncio
+    async def test_save_batch_dedups_screenshots(self, exporter):
+        session_title = "Test Session"
+        shot = b"fake_png_bytes"
+        await exporter.save_batch(session_title, [{"id": 1}, {"id": 2}], [shot, shot])
+        await exporter.save_batch(session_title, [{"id": 3}], [shot])
+        exporter.flush()
+
+        images_dir = Path(self.temp_dir) / "Test_Session" / "images"
+        assert len(list(images_dir.iterdir())) == 1
+
+        raw_jsonl = Path(self.temp_dir) / "Test_Session" / "data" / "raw_data.jsonl"
+        paths = {
+            json.loads(line)["_metadata"]["screenshot_path"]
+            for line in raw_jsonl.read_text().splitlines()
+        }
+        assert len(paths) == 1
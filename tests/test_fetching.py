@@ -1,30 +1,113 @@
 import asyncio
+import json
 import pytest
-from unittest.mock import MagicMock, patch, AsyncMock
-from src.fetching.rate_limiter import RateLimiter
-from src.fetching.engine import FetchingEngine
-from src.core.config import config
+from unittest.mock import patch, AsyncMock
+from src.fetching.rate_limiter import RateLimiter, TokenBucket
+from src.fetching.dedup import NearDuplicateIndex
 
 
 @pytest.mark.asyncio
 async def test_rate_limiter():
+    # Frozen clock and recorded sleeps: the test never waits on real time
+    with (
+        patch("src.fetching.rate_limiter.time.monotonic", return_value=100.0),
+        patch(
+            "src.fetching.rate_limiter.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep,
+    ):
+        limiter = RateLimiter()
+        limiter.global_bucket = TokenBucket(rate=100.0, capacity=10.0)
+        limiter.domain_limit = 2.0
+        limiter.burst = 1.0
+
+        await limiter.acquire("example.com")
+        mock_sleep.assert_not_awaited()
+
+        # Burst spent: the next request waits one domain interval
+        await limiter.acquire("example.com")
+        mock_sleep.assert_awaited_once_with(pytest.approx(0.5))
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_domains_independent():
+    with (
+        patch("src.fetching.rate_limiter.time.monotonic", return_value=100.0),
+        patch(
+            "src.fetching.rate_limiter.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep,
+    ):
+        limiter = RateLimiter()
+        limiter.global_bucket = TokenBucket(rate=1000.0, capacity=10.0)
+        limiter.domain_limit = 1.0
+        limiter.burst = 1.0
+
+        await asyncio.gather(
+            *(limiter.acquire(f"site{i}.example.com") for i in range(5))
+        )
+
+    # One request per distinct domain never waits on another domain's bucket
+    mock_sleep.assert_not_awaited()
+    assert len(limiter.domain_buckets) == 5
+
+
+def test_token_bucket_books_deficit():
+    bucket = TokenBucket(rate=2.0, capacity=1.0, last_refill=0.0)
+
+    assert bucket.reserve(0.0) == 0.0
+    # Bucket is empty: successive callers queue half a second apart
+    assert bucket.reserve(0.0) == pytest.approx(0.5)
+    assert bucket.reserve(0.0) == pytest.approx(1.0)
+    # Refill pays back the deficit without exceeding capacity
+    assert bucket.reserve(10.0) == 0.0
+    assert bucket.tokens == pytest.approx(0.0)
+    # A stale timestamp waits for the slot after the bucket clock
+    assert bucket.reserve(5.0) == pytest.approx(5.5)
+    assert bucket.last_refill == 10.5
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_global_rate_with_backlogged_domain():
+    with (
+        patch("src.fetching.rate_limiter.time.monotonic", return_value=100.0),
+        patch(
+            "src.fetching.rate_limiter.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep,
+    ):
+        limiter = RateLimiter()
+        limiter.global_bucket = TokenBucket(rate=10.0, capacity=1.0)
+        limiter.domain_limit = 2.0
+        limiter.burst = 1.0
+
+        # One slow domain backlogged, interleaved with fresh domains
+        gates = []
+        for i in range(20):
+            for domain in ("slow.example.com", f"site{i}.example.com"):
+                mock_sleep.reset_mock()
+                await limiter.acquire(domain)
+                waited = mock_sleep.await_args.args[0] if mock_sleep.await_args else 0
+                gates.append(100.0 + waited)
+
+    # Sends never come closer together than the global interval
+    gates.sort()
+    assert all(b - a >= 0.1 - 1e-9 for a, b in zip(gates, gates[1:]))
+
+
+def test_rate_limiter_prunes_idle_domains():
     limiter = RateLimiter()
-    limiter.global_limit = 100  # Fast for test
-    limiter.domain_limit = 100
+    limiter.domain_buckets = {
+        "idle.example.com": TokenBucket(rate=1.0, capacity=1.0, last_refill=0.0),
+        "busy.example.com": TokenBucket(rate=1.0, capacity=1.0, last_refill=100.0),
+    }
+    limiter.domain_buckets["busy.example.com"].reserve(100.0)
 
-    start = asyncio.get_running_loop().time()
-    await limiter.acquire("http://example.com")
-    await limiter.acquire("http://example.com")
-    end = asyncio.get_running_loop().time()
+    limiter._prune(100.0)
 
-    # Should be very fast since limits are high
-    assert end - start < 1.0
+    assert list(limiter.domain_buckets) == ["busy.example.com"]
 
 
 @pytest.mark.asyncio
-async def test_fetching_flow_http_success():
-    engine = FetchingEngine()
-    engine.rate_limiter.acquire = AsyncMock()
+async def test_fetching_flow_http_success(fetching_engine):
+    engine = fetching_engine
 
     # Mock HTTP fetch (Rust HPC)
     with patch(
@@ -42,9 +125,25 @@ async def test_fetching_flow_http_success():
 
 
 @pytest.mark.asyncio
-async def test_fetching_flow_browser_success():
-    engine = FetchingEngine()
-    engine.rate_limiter.acquire = AsyncMock()
+async def test_fetch_coalesces_stats(fetching_engine):
+    engine = fetching_engine
+    engine._fetch_http = AsyncMock(return_value=("<html>ok</html>", 200, None))
+
+    with patch("src.fetching.engine.event_bus.publish") as mock_publish:
+        for i in range(3):
+            await engine.fetch(f"http://example.com/{i}")
+        stats = [c for c in mock_publish.call_args_list if c.args[0] == "stats_update"]
+        # First fetch flushes immediately, the rest wait for the window
+        assert len(stats) == 1
+
+        engine.flush_stats()
+        stats = [c for c in mock_publish.call_args_list if c.args[0] == "stats_update"]
+        assert stats[-1].kwargs == {"metric": "pages_scanned", "increment": 2}
+
+
+@pytest.mark.asyncio
+async def test_fetching_flow_browser_success(fetching_engine):
+    engine = fetching_engine
 
     # Mock Browser fetch (Rust Mirage)
     with patch(
@@ -64,8 +163,8 @@ async def test_fetching_flow_browser_success():
 
 
 @pytest.mark.asyncio
-async def test_escalation_logic():
-    engine = FetchingEngine()
+async def test_escalation_logic(fetching_engine):
+    engine = fetching_engine
 
     # Should escalate on 403
     assert engine._should_escalate(403, "") is True
@@ -78,3 +177,75 @@ async def test_escalation_logic():
 
     # Should not escalate on normal 200
     assert engine._should_escalate(200, "<html>Normal content</html>") is False
+
+    # Large 200 pages that merely mention a marker are not challenge pages
+    large_page = "cloudflare " + "x" * 70000
+    assert engine._should_escalate(200, large_page) is False
+
+    # ...but a large, script-heavy challenge page still escalates
+    large_challenge = (
+        "<html><title>Just a moment...</title><p>Checking your browser (cloudflare)</p>"
+        "<script>" + "var a=1;" * 10000 + "</script></html>"
+    )
+    assert engine._should_escalate(200, large_challenge) is True
+
+    # A large real page whose bulk is an inline JSON state blob is not
+    state = json.dumps(
+        {
+            "items": [
+                {"id": i, "name": f"Item {i}", "tags": ["a", "b"]} for i in range(3000)
+            ]
+        }
+    )
+    json_page = (
+        '<html><head><script src="https://cdnjs.cloudflare.com/lib.js"></script></head>'
+        f'<body><script id="__STATE__" type="application/json">{state}</script></body></html>'
+    )
+    assert len(json_page) > 65536
+    assert engine._should_escalate(200, json_page) is False
+
+
+def test_near_duplicate_index():
+    index = NearDuplicateIndex(threshold=0.9)
+    words = " ".join(f"word{i}" for i in range(500))
+
+    assert index.check_and_add("http://a.com/1", words) is None
+    # Same page with a tiny change is flagged against the first URL
+    assert index.check_and_add("http://a.com/2", words + " footer") == "http://a.com/1"
+    # Unrelated content is indexed as new
+    other = " ".join(f"other{i}" for i in range(500))
+    assert index.check_and_add("http://b.com/1", other) is None
+
+    # Only byte-identical content counts as an exact duplicate
+    assert index.is_exact_duplicate("http://a.com/1", words)
+    assert not index.is_exact_duplicate("http://a.com/1", words + " footer")
+
+
+def test_near_duplicate_index_is_bounded():
+    index = NearDuplicateIndex(threshold=0.9, max_entries=2)
+    pages = [" ".join(f"page{n}word{i}" for i in range(50)) for n in range(3)]
+
+    for n, page in enumerate(pages):
+        assert index.check_and_add(f"http://a.com/{n}", page) is None
+
+    # The oldest page was evicted, from the signatures and every band bucket
+    assert len(index._signatures) == 2
+    assert all(
+        "http://a.com/0" not in keys
+        for bucket in index._buckets
+        for keys in bucket.values()
+    )
+    assert index.check_and_add("http://b.com/0", pages[0]) is None
+
+
+def test_near_duplicate_index_large_page_and_clear():
+    index = NearDuplicateIndex(threshold=0.9)
+    # Spans several shingle chunks
+    page = " ".join(f"word{i}" for i in range(5000))
+
+    assert index.check_and_add("http://a.com/1", page) is None
+    assert index.check_and_add("http://a.com/2", page + " footer") == "http://a.com/1"
+
+    # A new session starts with an empty index
+    index.clear()
+    assert index.check_and_add("http://a.com/2", page) is None
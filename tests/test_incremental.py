@@ -1,16 +1,11 @@
 import pytest
-import asyncio
-from unittest.mock import MagicMock, patch, AsyncMock
-from src.fetching.engine import FetchingEngine
-from src.data.cache import CacheManager
+from unittest.mock import patch, AsyncMock
 
 
 @pytest.mark.asyncio
-async def test_incremental_scraping_logic():
+async def test_incremental_scraping_logic(fetching_engine):
     # Setup
-    engine = FetchingEngine()
-    # Use an in-memory DB for testing
-    engine.cache = CacheManager(":memory:")
+    engine = fetching_engine
 
     url = "https://example.com/data"
     content = "<html>Data</html>"
@@ -49,9 +44,8 @@ async def test_incremental_scraping_logic():
 
 
 @pytest.mark.asyncio
-async def test_content_deduplication():
-    engine = FetchingEngine()
-    engine.cache = CacheManager(":memory:")
+async def test_content_deduplication(fetching_engine):
+    engine = fetching_engine
 
     url = "https://example.com/dynamic"
     content = "Same Content"
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock, patch
 from src.agent.nodes import fetcher_node, extractor_node, healing_node
 from src.agent.state import AgentState
 
@@ -37,13 +37,46 @@ async def test_generate_title():
     client.fast_model.generate_content_async.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_analyze_relevance_batch():
+    client = GeminiClient()
+    client.fast_model = MagicMock()
+    client.fast_model.generate_content_async = AsyncMock(
+        return_value=MagicMock(
+            text='```json\n[{"relevance_score": 90, "next_urls": []},'
+            ' {"relevance_score": 5, "next_urls": []}]\n```'
+        )
+    )
+    pages = [("http://a.com", "A"), ("http://b.com", "B")]
+
+    results = await client.analyze_relevance_batch("Objective", pages)
+
+    assert [r["relevance_score"] for r in results] == [90, 5]
+    client.fast_model.generate_content_async.assert_called_once()
+
+    # A reply that doesn't line up with the pages is retried per page
+    client.fast_model.generate_content_async = AsyncMock(
+        side_effect=[
+            MagicMock(text='[{"relevance_score": 90, "next_urls": []}]'),
+            MagicMock(text='{"relevance_score": 70, "next_urls": []}'),
+            MagicMock(text='{"relevance_score": 20, "next_urls": []}'),
+        ]
+    )
+
+    results = await client.analyze_relevance_batch("Objective", pages)
+
+    assert [r["relevance_score"] for r in results] == [70, 20]
+
+
 @pytest.mark.asyncio
 async def test_relevance_node_generates_title():
     # Mock dependencies
     with patch("src.agent.nodes.gemini_client") as mock_gemini:
         # Setup mocks
-        mock_gemini.analyze_relevance = AsyncMock(
-            return_value={"is_relevant": True, "reason": "Relevant", "next_urls": []}
+        mock_gemini.analyze_relevance_batch = AsyncMock(
+            return_value=[
+                {"relevance_score": 90, "reason": "Relevant", "next_urls": []}
+            ]
         )
         mock_gemini.analyze_api_endpoints = AsyncMock(return_value=[])
         mock_gemini.generate_title = AsyncMock(return_value="Generated Title")
@@ -78,8 +111,10 @@ async def test_relevance_node_skips_title_if_already_set():
     # Mock dependencies
     with patch("src.agent.nodes.gemini_client") as mock_gemini:
         # Setup mocks
-        mock_gemini.analyze_relevance = AsyncMock(
-            return_value={"is_relevant": True, "reason": "Relevant", "next_urls": []}
+        mock_gemini.analyze_relevance_batch = AsyncMock(
+            return_value=[
+                {"relevance_score": 90, "reason": "Relevant", "next_urls": []}
+            ]
         )
         mock_gemini.analyze_api_endpoints = AsyncMock(return_value=[])
 
@@ -1,26 +1,22 @@
 import pytest
 import asyncio
-from unittest.mock import MagicMock, AsyncMock, patch
+from unittest.mock import AsyncMock, patch
 from src.agent.nodes import (
     fetcher_node,
     relevance_analyzer_node,
     crawl_manager_node,
     refinement_node,
 )
-from src.agent.state import AgentState
 
 
 @pytest.mark.asyncio
-async def test_crawl_manager_batching():
+async def test_crawl_manager_batching(make_state):
     # Ensure batch size is 5 for this test
     from src.core.config import config
 
     config.BATCH_SIZE = 5
 
-    state = AgentState(
-        session_title="Test",
-        objective="Test",
-        data_schema={},
+    state = make_state(
         url_queue=[
             "http://a.com",
             "http://b.com",
@@ -28,19 +24,7 @@ async def test_crawl_manager_batching():
             "http://d.com",
             "http://e.com",
             "http://f.com",
-        ],
-        visited_urls=set(),
-        failed_urls=set(),
-        extracted_data=[],
-        current_urls=[],
-        current_contents=[],
-        current_screenshots=[],
-        relevant_flags=[],
-        batch_next_urls=[],
-        template_groups={},
-        optimized_templates=set(),
-        compressed_history="",
-        recent_activity=[],
+        ]
     )
 
     # Should pop 5 (BATCH_SIZE)
@@ -58,27 +42,46 @@ async def test_crawl_manager_batching():
 
 
 @pytest.mark.asyncio
-async def test_fetcher_node_parallel():
-    state = AgentState(
-        session_title="Test",
-        objective="Test",
-        data_schema={},
+async def test_crawl_manager_spreads_domains(make_state):
+    from src.core.config import config
+
+    state = make_state(
+        url_queue=[
+            "http://a.com/1",
+            "http://a.com/2",
+            "http://seen.com/",
+            "http://b.com/1",
+            "http://a.com/3",
+            "http://c.com/1",
+            "http://a.com/4",
+        ],
+        visited_urls={"http://seen.com/"},
+    )
+
+    with patch.object(config, "BATCH_SIZE", 4):
+        result = await crawl_manager_node(state)
+
+    # One URL per host first, then topped up in queue order
+    assert result["current_urls"] == [
+        "http://a.com/1",
+        "http://b.com/1",
+        "http://c.com/1",
+        "http://a.com/2",
+    ]
+    # Unpicked URLs keep their order; visited ones are dropped
+    assert result["url_queue"] == ["http://a.com/3", "http://a.com/4"]
+
+
+@pytest.mark.asyncio
+async def test_fetcher_node_parallel(make_state):
+    state = make_state(
         url_queue=["http://existing.com"],
         visited_urls={"http://visited.com"},
-        failed_urls=set(),
-        extracted_data=[],
         current_urls=["http://a.com", "http://b.com"],
-        current_contents=[],
-        current_screenshots=[],
-        relevant_flags=[],
         batch_next_urls=[
             ["http://new1.com", "http://visited.com"],
             ["http://new2.com", "http://existing.com"],
         ],
-        template_groups={},
-        optimized_templates=set(),
-        compressed_history="",
-        recent_activity=[],
     )
 
     with patch("src.agent.nodes.fetching_engine") as mock_engine:
@@ -95,47 +98,102 @@ async def test_fetcher_node_parallel():
 
 
 @pytest.mark.asyncio
-async def test_relevance_analyzer_parallel():
-    state = AgentState(
-        session_title="Test",
-        objective="Test",
-        data_schema={},
-        url_queue=[],
-        visited_urls=set(),
-        failed_urls=set(),
-        extracted_data=[],
+async def test_fetcher_node_groups_domains(make_state):
+    state = make_state(
+        current_urls=["http://a.com/1", "http://b.com/1", "http://a.com/2"]
+    )
+
+    in_flight = {"a.com": 0}
+    max_in_flight = {"a.com": 0}
+
+    async def fake_fetch(url):
+        domain = url.split("/")[2]
+        if domain == "a.com":
+            in_flight[domain] += 1
+            max_in_flight[domain] = max(max_in_flight[domain], in_flight[domain])
+        await asyncio.sleep(0)
+        if domain == "a.com":
+            in_flight[domain] -= 1
+        return f"Content {url}", 200, b""
+
+    with patch("src.agent.nodes.fetching_engine") as mock_engine:
+        mock_engine.fetch = AsyncMock(side_effect=fake_fetch)
+
+        result = await fetcher_node(state)
+
+    # Results keep batch order; same-domain URLs never overlap
+    assert result["current_contents"] == [
+        "Content http://a.com/1",
+        "Content http://b.com/1",
+        "Content http://a.com/2",
+    ]
+    assert max_in_flight["a.com"] == 1
+
+
+@pytest.mark.asyncio
+async def test_relevance_analyzer_parallel(make_state):
+    state = make_state(
         current_urls=["http://a.com", "http://b.com"],
         current_contents=["Content A", "Content B"],
-        current_screenshots=[],
-        relevant_flags=[],
-        batch_next_urls=[],
-        template_groups={},
-        optimized_templates=set(),
-        compressed_history="",
-        recent_activity=[],
     )
 
     with patch("src.agent.nodes.gemini_client") as mock_client:
-        mock_client.analyze_relevance = AsyncMock(
-            side_effect=[
-                {"is_relevant": True, "next_urls": ["http://x.com"]},
-                {"is_relevant": False, "next_urls": []},
+        mock_client.analyze_relevance_batch = AsyncMock(
+            return_value=[
+                {"relevance_score": 80, "next_urls": ["http://x.com"]},
+                {"relevance_score": 10, "next_urls": []},
             ]
         )
         mock_client.analyze_api_endpoints = AsyncMock(return_value=[])
 
         result = await relevance_analyzer_node(state)
 
+        # The whole batch is scored with a single request
+        mock_client.analyze_relevance_batch.assert_awaited_once_with(
+            "Test", [("http://a.com", "Content A"), ("http://b.com", "Content B")]
+        )
+
         assert result["relevant_flags"] == [True, False]
         assert result["batch_next_urls"] == [["http://x.com"], []]
 
 
 @pytest.mark.asyncio
-async def test_refinement_node_flattening():
-    state = AgentState(
-        session_title="Test",
-        objective="Test",
-        data_schema={},
+async def test_relevance_analyzer_isolates_page_failures(make_state):
+    state = make_state(
+        current_urls=["http://a.com", "http://b.com"],
+        current_contents=["A" * 30000, "Content B"],
+    )
+
+    with (
+        patch("src.agent.nodes.gemini_client") as mock_client,
+        patch("src.agent.nodes.context_compressor") as mock_compressor,
+    ):
+        mock_compressor.compress_observation = AsyncMock(
+            side_effect=RuntimeError("boom")
+        )
+        mock_client.analyze_relevance_batch = AsyncMock(
+            return_value=[
+                {"relevance_score": 80, "next_urls": []},
+                {"relevance_score": 90, "next_urls": []},
+            ]
+        )
+        mock_client.analyze_api_endpoints = AsyncMock(
+            side_effect=[RuntimeError("boom"), ["http://b.com/api"]]
+        )
+
+        result = await relevance_analyzer_node(state)
+
+        # The page whose compression failed is scored on a truncated copy
+        pages = mock_client.analyze_relevance_batch.await_args.args[1]
+        assert pages[0] == ("http://a.com", "A" * 20000)
+
+        assert result["relevant_flags"] == [True, True]
+        assert result["batch_next_urls"] == [[], ["http://b.com/api"]]
+
+
+@pytest.mark.asyncio
+async def test_refinement_node_flattening(make_state):
+    state = make_state(
         url_queue=[
             "http://a.com",
             "http://b.com",
@@ -143,22 +201,13 @@ async def test_refinement_node_flattening():
             "http://d.com",
             "http://e.com",
             "http://f.com",
+            "http://existing.com",
         ],
-        visited_urls=set(),
-        failed_urls=set(),
-        extracted_data=[],
-        current_urls=[],
-        current_contents=[],
-        current_screenshots=[],
-        relevant_flags=[],
+        visited_urls={"http://visited.com"},
         batch_next_urls=[
             ["http://new1.com", "http://visited.com"],
-            ["http://new2.com", "http://existing.com"],
+            ["http://new2.com", "http://existing.com", "http://new1.com"],
         ],
-        template_groups={},
-        optimized_templates=set(),
-        compressed_history="",
-        recent_activity=[],
     )
 
     result = await refinement_node(state)
@@ -174,5 +223,27 @@ async def test_refinement_node_flattening():
     # Let's check if the new URLs are present
     assert "http://new1.com" in queue
     assert "http://new2.com" in queue
-    # existing.com was already in queue, so it should remain
-    assert "http://existing.com" in queue
+    # existing.com was already in queue, so it should remain exactly once
+    assert queue.count("http://existing.com") == 1
+    # Repeats across the batch are only enqueued once
+    assert queue.count("http://new1.com") == 1
+    assert "http://visited.com" not in queue
+
+
+@pytest.mark.asyncio
+async def test_refinement_respects_queue_cap(make_state):
+    from src.core.config import config
+
+    state = make_state(
+        url_queue=["http://existing.com"],
+        batch_next_urls=[["http://new1.com", "http://new2.com", "http://new3.com"]],
+    )
+
+    with patch.object(config, "MAX_QUEUE_SIZE", 3):
+        result = await refinement_node(state)
+
+    assert result["url_queue"] == [
+        "http://existing.com",
+        "http://new1.com",
+        "http://new2.com",
+    ]